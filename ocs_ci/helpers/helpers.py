@@ -8,16 +8,18 @@ import hashlib
 import json
 import logging
 import os
+import pickle
 import re
+import secrets
 import statistics
 import tempfile
-import threading
 import time
 import inspect
-from concurrent.futures import ThreadPoolExecutor
-from itertools import cycle
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from functools import lru_cache, partial
+from itertools import chain, count, cycle
 from subprocess import PIPE, TimeoutExpired, run
-from uuid import uuid4
 
 import yaml
 
@@ -40,6 +42,7 @@ from ocs_ci.ocs.resources import pod, pvc
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.utility import templating
 from ocs_ci.utility.retry import retry
+from ocs_ci.utility.ttl_cache import ttl_cache
 from ocs_ci.utility.utils import (
     TimeoutSampler,
     ocsci_log_path,
@@ -50,13 +53,177 @@ from ocs_ci.utility.utils import (
 
 logger = logging.getLogger(__name__)
 DATE_TIME_FORMAT = "%Y I%m%d %H:%M:%S.%f"
+# CSI provisioner log lines of PVC provisioning and PV deletion, e.g.
+# ... provision "namespace/pvc-name" class "sc-name": started
+# ... delete "pvc-uuid": succeeded
+PVC_PROVISION_LOG_PATTERN = re.compile(
+    r'provision "(?:[^"/]*/)?([^"]+)".*?: (started|succeeded)'
+)
+PV_DELETE_LOG_PATTERN = re.compile(r'delete "([^"]+)": (started|succeeded)')
+# Mount point of a PV in the df output of a node, e.g.
+# ... /var/lib/kubelet/plugins/kubernetes.io/csi/pv/pvc-uuid/globalmount
+PV_MOUNT_PATTERN = re.compile(r"/pv/([^/\s]+)/")
+# Timestamp at the start of an event line, e.g.
+# 2021-03-23 13:40:44.123456 I | ... or 2021-03-23T13:40:44.123Z ...
+EVENT_LINE_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}(T)?")
+# Default resources which are never waited for by wait_for_resource(s)_state
+NO_WAIT_RESOURCE_NAMES = frozenset(
+    {constants.DEFAULT_STORAGECLASS_CEPHFS, constants.DEFAULT_STORAGECLASS_RBD}
+)
+# Unique resource names are built from a random token generated once per
+# process and a counter, which is much cheaper than a new uuid per name
+RESOURCE_NAME_TOKEN = secrets.token_hex(4)
+resource_name_counter = count()
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_cached(yaml_path):
+    """
+    Load and parse a YAML template only once per path. The parsed data is
+    kept pickled, so each caller of load_yaml_template() can cheaply get its
+    own copy which is safe to modify
+
+    Args:
+        yaml_path (str): Path to the YAML template
+
+    Returns:
+        bytes: Pickled data of the parsed YAML template
+
+    """
+    return pickle.dumps(templating.load_yaml(yaml_path), pickle.HIGHEST_PROTOCOL)
+
+
+def load_yaml_template(yaml_path):
+    """
+    Get a private copy of a (cached) YAML template
+
+    Args:
+        yaml_path (str): Path to the YAML template
+
+    Returns:
+        dict: Parsed YAML template which can be modified by the caller
+
+    """
+    return pickle.loads(_load_yaml_cached(yaml_path))
+
+
+def _parallel_map(func, items, max_workers=16):
+    """
+    Call func on each item concurrently using a bounded thread pool. The
+    number of workers is capped to avoid hitting the API server rate limits
+
+    Args:
+        func (function): The function to call with each item
+        items (iterable): The items to process
+        max_workers (int): Maximum number of concurrent calls
+
+    Returns:
+        list: The results of func, in the same order as items
+
+    """
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def _current_cluster():
+    """
+    Identify the cluster the config currently points to, used as a scope of
+    the cluster level caches
+
+    Returns:
+        tuple: The cluster index and the cluster namespace
+
+    """
+    return config.cur_index, config.ENV_DATA["cluster_namespace"]
+
+
+@ttl_cache(ttl=300, scope=_current_cluster)
+def get_cached_ceph_tools_pod():
+    """
+    Get the Ceph tools pod, reusing the result of a recent lookup on the
+    same cluster. Use clear_ceph_tools_pod_cache() once the Ceph tools pod
+    is known to be recreated
+
+    Returns:
+        Pod object: The Ceph tools pod object
+
+    """
+    return pod.get_ceph_tools_pod()
+
+
+def add_ceph_connect_timeout(ceph_cmd):
+    """
+    Add the --connect-timeout option to a 'ceph' command, so the command
+    fails fast when the monitors are not reachable instead of blocking for
+    minutes. Other commands (e.g. rbd) are returned unchanged. The timeout
+    is taken from the RUN['ceph_cmd_connect_timeout'] config
+
+    Args:
+        ceph_cmd (str): The command to run on the Ceph tools pod
+
+    Returns:
+        str: The command with the connect timeout
+
+    """
+    if not ceph_cmd.startswith("ceph "):
+        return ceph_cmd
+    timeout = config.RUN.get("ceph_cmd_connect_timeout", 15)
+    return f"{ceph_cmd} --connect-timeout {timeout}"
+
+
+def exec_ceph_cmd_on_tools_pod(ceph_cmd, format="json-pretty"):
+    """
+    Run a Ceph command on the cached Ceph tools pod. If the command fails,
+    the Ceph tools pod is looked up again and the command is retried once in
+    case the pod was replaced in the meantime
+
+    Args:
+        ceph_cmd (str): The Ceph command to run
+        format (str): The output format of the Ceph command
+
+    Returns:
+        dict: Ceph command output
+
+    Raises:
+        CommandFailed: In case the command fails on the current Ceph tools pod
+
+    """
+    ceph_cmd = add_ceph_connect_timeout(ceph_cmd)
+    ct_pod = get_cached_ceph_tools_pod()
+    try:
+        return ct_pod.exec_ceph_cmd(ceph_cmd, format=format)
+    except CommandFailed:
+        clear_ceph_tools_pod_cache()
+        new_ct_pod = get_cached_ceph_tools_pod()
+        if new_ct_pod.name == ct_pod.name:
+            raise
+    logger.info(
+        f"Ceph tools pod was replaced by {new_ct_pod.name}, running "
+        f"'{ceph_cmd}' again"
+    )
+    return new_ct_pod.exec_ceph_cmd(ceph_cmd, format=format)
+
+
+def clear_ceph_tools_pod_cache():
+    """
+    Drop the cached Ceph tools pod and the values fetched through it
+
+    """
+    get_cached_ceph_tools_pod.cache_clear()
+    get_admin_key.cache_clear()
+    get_cephfs_name.cache_clear()
 
 
 def create_unique_resource_name(resource_description, resource_type):
     """
     Creates a unique object name by using the object_description,
-    object_type and a random uuid(in hex) as suffix trimmed due to
-    kubernetes limitation of 63 characters
+    object_type and a suffix made of a per-process random token and a
+    counter. The name is limited to 40 characters (due to kubernetes
+    limitation of 63 characters), which is done by trimming the
+    description, so the unique suffix is always kept
 
     Args:
         resource_description (str): The user provided object description
@@ -66,8 +233,9 @@ def create_unique_resource_name(resource_description, resource_type):
     Returns:
         str: A unique name
     """
-    name = f"{resource_type}-{resource_description[:23]}-{uuid4().hex}"
-    return name if len(name) < 40 else name[:40]
+    suffix = f"{RESOURCE_NAME_TOKEN}{next(resource_name_counter):x}"
+    prefix = f"{resource_type}-{resource_description[:23]}"
+    return f"{prefix[:39 - len(suffix)]}-{suffix}"
 
 
 def create_resource(do_reload=True, **kwargs):
@@ -92,29 +260,39 @@ def create_resource(do_reload=True, **kwargs):
     return ocs_obj
 
 
-def wait_for_resource_state(resource, state, timeout=60):
+def wait_for_resource_state(
+    resource, state, timeout=60, sleep=1, backoff_factor=2, max_sleep=8
+):
     """
-    Wait for a resource to get to a given status
+    Wait for a resource to get to a given status. The resource is sampled
+    with an exponential backoff, so quick state transitions are noticed
+    early while long waits don't overload the API server
 
     Args:
         resource (OCS obj): The resource object
         state (str): The status to wait for
         timeout (int): Time in seconds to wait
+        sleep (int): Initial sampling time in seconds
+        backoff_factor (int): Multiplier of the sampling time after each
+            sample, 1 for a fixed sampling time
+        max_sleep (int): Upper limit of the sampling time in seconds
 
     Raises:
         ResourceWrongStatusException: In case the resource hasn't
             reached the desired state
 
     """
-    if (
-        resource.name == constants.DEFAULT_STORAGECLASS_CEPHFS
-        or resource.name == constants.DEFAULT_STORAGECLASS_RBD
-    ):
+    if resource.name in NO_WAIT_RESOURCE_NAMES:
         logger.info("Attempt to default default Secret or StorageClass")
         return
     try:
         resource.ocp.wait_for_resource(
-            condition=state, resource_name=resource.name, timeout=timeout
+            condition=state,
+            resource_name=resource.name,
+            timeout=timeout,
+            sleep=sleep,
+            backoff_factor=backoff_factor,
+            max_sleep=max_sleep,
         )
     except TimeoutExpiredError:
         logger.error(f"{resource.kind} {resource.name} failed to reach {state}")
@@ -123,6 +301,97 @@ def wait_for_resource_state(resource, state, timeout=60):
     logger.info(f"{resource.kind} {resource.name} reached state {state}")
 
 
+def get_resources_status(kind, namespace):
+    """
+    Get the STATUS column of all the resources of a kind in a namespace,
+    using a single 'oc get' call
+
+    Args:
+        kind (str): The kind of the resources
+        namespace (str): The namespace of the resources
+
+    Returns:
+        dict: The resource names as keys and their statuses as values
+
+    """
+    out = OCP(kind=kind, namespace=namespace).get(out_yaml_format=False)
+    lines = [line for line in out.splitlines() if line.strip()]
+    if not lines:
+        return {}
+    column_index = re.split(r"\s{2,}", lines[0].strip()).index("STATUS")
+    return {
+        values[0]: values[column_index]
+        for values in (line.split() for line in lines[1:])
+        if len(values) > column_index
+    }
+
+
+def wait_for_resources_state(
+    resources, state, timeout=60, sleep=1, backoff_factor=2, max_sleep=8
+):
+    """
+    Wait for multiple resources to get to a given status. The resources are
+    grouped by their kind and namespace and each group is sampled with a
+    single 'oc get' call, instead of sampling every resource on its own
+
+    Args:
+        resources (list): The resource objects
+        state (str): The status to wait for
+        timeout (int): Time in seconds to wait
+        sleep (int): Initial sampling time in seconds
+        backoff_factor (int): Multiplier of the sampling time after each
+            sample, 1 for a fixed sampling time
+        max_sleep (int): Upper limit of the sampling time in seconds
+
+    Raises:
+        ResourceWrongStatusException: In case any of the resources hasn't
+            reached the desired state
+
+    """
+    pending = {}
+    for resource in resources:
+        if resource.name in NO_WAIT_RESOURCE_NAMES:
+            continue
+        group = pending.setdefault((resource.kind, resource.namespace), {})
+        group[resource.name] = resource
+
+    if not pending:
+        return
+
+    def get_statuses():
+        return {group: get_resources_status(*group) for group in pending}
+
+    sampler = TimeoutSampler(timeout, sleep, get_statuses)
+    sampler.backoff_factor = backoff_factor
+    sampler.max_sleep = max_sleep
+    try:
+        for statuses in sampler:
+            for group, group_statuses in statuses.items():
+                pending[group] = {
+                    name: resource
+                    for name, resource in pending[group].items()
+                    if group_statuses.get(name) != state
+                }
+                if not pending[group]:
+                    del pending[group]
+            if not pending:
+                break
+            logger.info(
+                f"{sum(len(group) for group in pending.values())} resources "
+                f"are not in {state} state yet"
+            )
+    except TimeoutExpiredError:
+        not_ready = [
+            resource for group in pending.values() for resource in group.values()
+        ]
+        for resource in not_ready:
+            logger.error(f"{resource.kind} {resource.name} failed to reach {state}")
+        resource = not_ready[0]
+        resource.reload()
+        raise ResourceWrongStatusException(resource.name, resource.describe())
+    logger.info(f"All the resources reached state {state}")
+
+
 def create_pod(
     interface_type=None,
     pvc_name=None,
@@ -185,7 +454,7 @@ def create_pod(
         interface = constants.CEPHFS_INTERFACE
     if dc_deployment:
         pod_dict = pod_dict_path if pod_dict_path else constants.FEDORA_DC_YAML
-    pod_data = templating.load_yaml(pod_dict)
+    pod_data = load_yaml_template(pod_dict)
     if not pod_name:
         pod_name = create_unique_resource_name(f"test-{interface}", "pod")
     pod_data["metadata"]["name"] = pod_name
@@ -194,98 +463,66 @@ def create_pod(
         pod_data["metadata"]["labels"]["app"] = pod_name
         pod_data["spec"]["template"]["metadata"]["labels"]["name"] = pod_name
         pod_data["spec"]["replicas"] = replica_count
+        pod_spec = pod_data["spec"]["template"]["spec"]
+    else:
+        pod_spec = pod_data["spec"]
 
     if pvc_name:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["volumes"][0]["persistentVolumeClaim"][
-                "claimName"
-            ] = pvc_name
-        else:
-            pod_data["spec"]["volumes"][0]["persistentVolumeClaim"][
-                "claimName"
-            ] = pvc_name
+        pod_spec["volumes"][0]["persistentVolumeClaim"]["claimName"] = pvc_name
 
     if interface_type == constants.CEPHBLOCKPOOL and raw_block_pv:
         if pod_dict_path in [constants.FEDORA_DC_YAML, constants.FIO_DC_YAML]:
+            tspec = pod_data["spec"]["template"]["spec"]
+            container = tspec["containers"][0]
             temp_dict = [
                 {
                     "devicePath": raw_block_device,
-                    "name": pod_data.get("spec")
-                    .get("template")
-                    .get("spec")
-                    .get("volumes")[0]
-                    .get("name"),
+                    "name": tspec["volumes"][0]["name"],
                 }
             ]
             if pod_dict_path == constants.FEDORA_DC_YAML:
-                del pod_data["spec"]["template"]["spec"]["containers"][0][
-                    "volumeMounts"
-                ]
+                del container["volumeMounts"]
                 security_context = {"capabilities": {"add": ["SYS_ADMIN"]}}
-                pod_data["spec"]["template"]["spec"]["containers"][0][
-                    "securityContext"
-                ] = security_context
+                container["securityContext"] = security_context
 
-            pod_data["spec"]["template"]["spec"]["containers"][0][
-                "volumeDevices"
-            ] = temp_dict
+            container["volumeDevices"] = temp_dict
 
         elif (
             pod_dict_path == constants.NGINX_POD_YAML
             or pod_dict == constants.CSI_RBD_POD_YAML
         ):
+            container = pod_data["spec"]["containers"][0]
             temp_dict = [
                 {
                     "devicePath": raw_block_device,
-                    "name": pod_data.get("spec")
-                    .get("containers")[0]
-                    .get("volumeMounts")[0]
-                    .get("name"),
+                    "name": container["volumeMounts"][0]["name"],
                 }
             ]
-            del pod_data["spec"]["containers"][0]["volumeMounts"]
-            pod_data["spec"]["containers"][0]["volumeDevices"] = temp_dict
+            del container["volumeMounts"]
+            container["volumeDevices"] = temp_dict
         else:
-            pod_data["spec"]["containers"][0]["volumeDevices"][0][
-                "devicePath"
-            ] = raw_block_device
-            pod_data["spec"]["containers"][0]["volumeDevices"][0]["name"] = (
-                pod_data.get("spec").get("volumes")[0].get("name")
-            )
+            cspec = pod_data["spec"]
+            volume_device = cspec["containers"][0]["volumeDevices"][0]
+            volume_device["devicePath"] = raw_block_device
+            volume_device["name"] = cspec["volumes"][0]["name"]
 
+    container = pod_spec["containers"][0]
     if command:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["containers"][0]["command"] = command
-        else:
-            pod_data["spec"]["containers"][0]["command"] = command
+        container["command"] = command
     if command_args:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["containers"][0]["args"] = command_args
-        else:
-            pod_data["spec"]["containers"][0]["args"] = command_args
+        container["args"] = command_args
 
     if node_name:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["nodeName"] = node_name
-        else:
-            pod_data["spec"]["nodeName"] = node_name
+        pod_spec["nodeName"] = node_name
 
     if node_selector:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["nodeSelector"] = node_selector
-        else:
-            pod_data["spec"]["nodeSelector"] = node_selector
+        pod_spec["nodeSelector"] = node_selector
 
     if sa_name and dc_deployment:
-        pod_data["spec"]["template"]["spec"]["serviceAccountName"] = sa_name
+        pod_spec["serviceAccountName"] = sa_name
 
     if subpath:
-        if dc_deployment:
-            pod_data["spec"]["template"]["spec"]["containers"][0]["volumeMounts"][0][
-                "subPath"
-            ] = subpath
-        else:
-            pod_data["spec"]["containers"][0]["volumeMounts"][0]["subPath"] = subpath
+        container["volumeMounts"][0]["subPath"] = subpath
 
     # overwrite used image (required for disconnected installation)
     update_container_with_mirrored_image(pod_data)
@@ -310,7 +547,6 @@ def create_pod(
                     return dpod
     else:
         pod_obj = pod.Pod(**pod_data)
-        pod_name = pod_data.get("metadata").get("name")
         logger.info(f"Creating new Pod {pod_name} for test")
         created_resource = pod_obj.create(do_reload=do_reload)
         assert created_resource, f"Failed to create Pod {pod_name}"
@@ -346,7 +582,7 @@ def create_multilpe_projects(number_of_project):
          list: List of project objects
 
     """
-    project_objs = [create_project() for _ in range(number_of_project)]
+    project_objs = _parallel_map(lambda _: create_project(), range(number_of_project))
     return project_objs
 
 
@@ -365,12 +601,12 @@ def create_secret(interface_type):
     """
     secret_data = dict()
     if interface_type == constants.CEPHBLOCKPOOL:
-        secret_data = templating.load_yaml(constants.CSI_RBD_SECRET_YAML)
+        secret_data = load_yaml_template(constants.CSI_RBD_SECRET_YAML)
         secret_data["stringData"]["userID"] = constants.ADMIN_USER
         secret_data["stringData"]["userKey"] = get_admin_key()
         interface = constants.RBD_INTERFACE
     elif interface_type == constants.CEPHFILESYSTEM:
-        secret_data = templating.load_yaml(constants.CSI_CEPHFS_SECRET_YAML)
+        secret_data = load_yaml_template(constants.CSI_CEPHFS_SECRET_YAML)
         del secret_data["stringData"]["userID"]
         del secret_data["stringData"]["userKey"]
         secret_data["stringData"]["adminID"] = constants.ADMIN_USER
@@ -392,7 +628,7 @@ def default_ceph_block_pool():
         default CephBlockPool
     """
     sc_obj = default_storage_class(constants.CEPHBLOCKPOOL)
-    cbp_name = sc_obj.get().get("parameters").get("pool")
+    cbp_name = sc_obj.data["parameters"].get("pool")
     return cbp_name if cbp_name else constants.DEFAULT_BLOCKPOOL
 
 
@@ -415,7 +651,7 @@ def create_ceph_block_pool(
     Returns:
         OCS: An OCS instance for the Ceph block pool
     """
-    cbp_data = templating.load_yaml(constants.CEPHBLOCKPOOL_YAML)
+    cbp_data = load_yaml_template(constants.CEPHBLOCKPOOL_YAML)
     cbp_data["metadata"]["name"] = (
         pool_name if pool_name else create_unique_resource_name("test", "cbp")
     )
@@ -450,7 +686,7 @@ def create_ceph_file_system(pool_name=None):
     Returns:
         OCS: An OCS instance for the Ceph file system
     """
-    cfs_data = templating.load_yaml(constants.CEPHFILESYSTEM_YAML)
+    cfs_data = load_yaml_template(constants.CEPHFILESYSTEM_YAML)
     cfs_data["metadata"]["name"] = (
         pool_name if pool_name else create_unique_resource_name("test", "cfs")
     )
@@ -464,6 +700,27 @@ def create_ceph_file_system(pool_name=None):
     return cfs_data
 
 
+@ttl_cache(ttl=600, scope=_current_cluster)
+def _wait_for_storage_class(resource_name):
+    """
+    Wait for a storage class to exist. Once a default storage class is found
+    the wait is skipped for a while, its data is still read on every use
+
+    Args:
+        resource_name (str): The name of the storage class
+
+    Returns:
+        bool: True once the storage class exists
+
+    """
+    OCP(kind="storageclass", resource_name=resource_name).wait_for_resource(
+        condition=resource_name,
+        column="NAME",
+        timeout=240,
+    )
+    return True
+
+
 def default_storage_class(
     interface_type,
 ):
@@ -483,18 +740,13 @@ def default_storage_class(
             resource_name = constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD
         else:
             resource_name = constants.DEFAULT_STORAGECLASS_RBD
-        base_sc = OCP(kind="storageclass", resource_name=resource_name)
     elif interface_type == constants.CEPHFILESYSTEM:
         if external:
             resource_name = constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_CEPHFS
         else:
             resource_name = constants.DEFAULT_STORAGECLASS_CEPHFS
-        base_sc = OCP(kind="storageclass", resource_name=resource_name)
-    base_sc.wait_for_resource(
-        condition=resource_name,
-        column="NAME",
-        timeout=240,
-    )
+    _wait_for_storage_class(resource_name)
+    base_sc = OCP(kind="storageclass", resource_name=resource_name)
     sc = OCS(**base_sc.data)
     return sc
 
@@ -557,7 +809,7 @@ def create_storage_class(
         constants.CEPHFILESYSTEM: constants.CSI_CEPHFS_STORAGECLASS_YAML,
     }
     sc_data = dict()
-    sc_data = templating.load_yaml(yamls[interface_type])
+    sc_data = load_yaml_template(yamls[interface_type])
 
     if interface_type == constants.CEPHBLOCKPOOL:
         interface = constants.RBD_INTERFACE
@@ -629,7 +881,7 @@ def create_pvc(
     Returns:
         PVC: PVC instance
     """
-    pvc_data = templating.load_yaml(constants.CSI_PVC_YAML)
+    pvc_data = load_yaml_template(constants.CSI_PVC_YAML)
     pvc_data["metadata"]["name"] = (
         pvc_name if pvc_name else create_unique_resource_name("test", "pvc")
     )
@@ -678,19 +930,19 @@ def create_multiple_pvcs(
             volume_mode = "Block"
         else:
             volume_mode = None
-        return [
-            create_pvc(
+        return _parallel_map(
+            lambda _: create_pvc(
                 sc_name=sc_name,
                 size=size,
                 namespace=namespace,
                 do_reload=do_reload,
                 access_mode=access_mode,
                 volume_mode=volume_mode,
-            )
-            for _ in range(number_of_pvc)
-        ]
+            ),
+            range(number_of_pvc),
+        )
 
-    pvc_data = templating.load_yaml(constants.CSI_PVC_YAML)
+    pvc_data = load_yaml_template(constants.CSI_PVC_YAML)
     pvc_data["metadata"]["namespace"] = namespace
     pvc_data["spec"]["accessModes"] = [access_mode]
     pvc_data["spec"]["storageClassName"] = sc_name
@@ -701,30 +953,53 @@ def create_multiple_pvcs(
     else:
         pvc_data["spec"]["volumeMode"] = None
 
-    # Creating tem directory to hold the files for the PVC creation
-    tmpdir = tempfile.mkdtemp()
-    logger.info("Creating the PVC yaml files for creation in bulk")
+    logger.info("Creating the PVC list for creation in bulk")
     ocs_objs = []
+    items = []
+    pvc_data_pickled = pickle.dumps(pvc_data, pickle.HIGHEST_PROTOCOL)
     for _ in range(number_of_pvc):
         name = create_unique_resource_name("test", "pvc")
         logger.info(f"Adding PVC with name {name}")
-        pvc_data["metadata"]["name"] = name
-        templating.dump_data_to_temp_yaml(pvc_data, f"{tmpdir}/{name}.yaml")
-        ocs_objs.append(pvc.PVC(**pvc_data))
+        item = pickle.loads(pvc_data_pickled)
+        item["metadata"]["name"] = name
+        items.append(item)
+        ocs_objs.append(pvc.PVC(**item))
+
+    # All the PVCs are placed in a single List yaml, so they are sent to the
+    # API server with one 'oc create' call. The file is kept in its own
+    # directory, so it can be used by delete_bulk_pvcs later on.
+    tmpdir = tempfile.mkdtemp()
+    pvc_list_yaml = os.path.join(tmpdir, "pvc_list.yaml")
+    templating.dump_data_to_temp_yaml(
+        {"apiVersion": "v1", "kind": "List", "items": items}, pvc_list_yaml
+    )
 
     logger.info("Creating all PVCs as bulk")
     oc = OCP(kind="pod", namespace=namespace)
-    cmd = f"create -f {tmpdir}/"
+    cmd = f"create -f {pvc_list_yaml}"
     oc.exec_oc_cmd(command=cmd, out_yaml_format=False)
 
-    # Letting the system 1 sec for each PVC to create.
-    # this will prevent any other command from running in the system in this
-    # period of time.
-    logger.info(
-        f"Going to sleep for {number_of_pvc} sec. "
-        "until starting verify that PVCs was created."
+    # Wait until the PVCs are provisioned instead of letting the system a
+    # fixed time for each PVC. PVCs of a storage class which waits for the
+    # first consumer are not bound before a pod uses them, so there is
+    # nothing to wait for. The callers verify the PVC state on their own,
+    # so a timeout is not fatal
+    binding_mode = (
+        OCP(kind=constants.STORAGECLASS, resource_name=sc_name)
+        .get()
+        .get("volumeBindingMode")
     )
-    time.sleep(number_of_pvc)
+    if binding_mode == "WaitForFirstConsumer":
+        logger.info(f"PVCs of {sc_name} are bound once a pod uses them")
+    else:
+        try:
+            wait_for_resources_state(
+                ocs_objs, constants.STATUS_BOUND, timeout=max(120, number_of_pvc * 5)
+            )
+        except ResourceWrongStatusException:
+            logger.warning(
+                f"Not all the {number_of_pvc} PVCs reached {constants.STATUS_BOUND}"
+            )
 
     return ocs_objs, tmpdir
 
@@ -757,13 +1032,15 @@ def verify_block_pool_exists(pool_name):
         bool: True if the Ceph block pool exists, False otherwise
     """
     logger.info(f"Verifying that block pool {pool_name} exists")
-    ct_pod = pod.get_ceph_tools_pod()
+    # The first sample is taken right away, which covers the common case of
+    # an existing pool. The listing is cheap, so poll it every second
     try:
-        for pools in TimeoutSampler(60, 3, ct_pod.exec_ceph_cmd, "ceph osd lspools"):
+        for pools in TimeoutSampler(
+            60, 1, exec_ceph_cmd_on_tools_pod, "ceph osd pool ls"
+        ):
             logger.info(f"POOLS are {pools}")
-            for pool in pools:
-                if pool_name in pool.get("poolname"):
-                    return True
+            if pool_name in set(pools):
+                return True
     except TimeoutExpiredError:
         return False
 
@@ -799,6 +1076,7 @@ def get_pool_cr(pool_name):
         return pool_cr
 
 
+@ttl_cache(ttl=300, scope=_current_cluster)
 def get_admin_key():
     """
     Fetches admin key secret from Ceph
@@ -806,8 +1084,7 @@ def get_admin_key():
     Returns:
         str: The admin key
     """
-    ct_pod = pod.get_ceph_tools_pod()
-    out = ct_pod.exec_ceph_cmd("ceph auth get-key client.admin")
+    out = exec_ceph_cmd_on_tools_pod("ceph auth get-key client.admin")
     return out["key"]
 
 
@@ -818,8 +1095,7 @@ def get_cephfs_data_pool_name():
     Returns:
         str: fs datapool name
     """
-    ct_pod = pod.get_ceph_tools_pod()
-    out = ct_pod.exec_ceph_cmd("ceph fs ls")
+    out = exec_ceph_cmd_on_tools_pod("ceph fs ls")
     return out[0]["data_pools"][0]
 
 
@@ -837,7 +1113,6 @@ def validate_cephfilesystem(fs_name):
     cfs = ocp.OCP(
         kind=constants.CEPHFILESYSTEM, namespace=defaults.ROOK_CLUSTER_NAMESPACE
     )
-    ct_pod = pod.get_ceph_tools_pod()
     ceph_validate = False
     ocp_validate = False
 
@@ -850,20 +1125,13 @@ def validate_cephfilesystem(fs_name):
         return False
 
     try:
-        for pools in TimeoutSampler(60, 3, ct_pod.exec_ceph_cmd, "ceph fs ls"):
-            for out in pools:
-                result = out.get("name")
-                if result == fs_name:
-                    logger.info("FileSystem %s got created from Ceph Side", fs_name)
-                    ceph_validate = True
-                    break
-                else:
-                    logger.error("FileSystem %s was not present at Ceph Side", fs_name)
-                    ceph_validate = False
-            if ceph_validate:
+        for pools in TimeoutSampler(60, 1, exec_ceph_cmd_on_tools_pod, "ceph fs ls"):
+            if fs_name in {out["name"] for out in pools}:
+                logger.info("FileSystem %s got created from Ceph Side", fs_name)
+                ceph_validate = True
                 break
     except TimeoutExpiredError:
-        pass
+        logger.error("FileSystem %s was not present at Ceph Side", fs_name)
 
     return True if (ceph_validate and ocp_validate) else False
 
@@ -920,13 +1188,11 @@ def get_all_storageclass_names():
     result = sc_obj.get()
     sample = result["items"]
 
+    ignored_sc_names = {constants.IGNORE_SC_GP2, constants.IGNORE_SC_FLEX}
     storageclass = [
-        item.get("metadata").get("name")
-        for item in sample
-        if (
-            (item.get("metadata").get("name") not in constants.IGNORE_SC_GP2)
-            and (item.get("metadata").get("name") not in constants.IGNORE_SC_FLEX)
-        )
+        name
+        for name in (item["metadata"]["name"] for item in sample)
+        if name not in ignored_sc_names
     ]
     return storageclass
 
@@ -942,9 +1208,11 @@ def delete_storageclasses(sc_objs):
         bool: True if deletion is successful
     """
 
-    for sc in sc_objs:
+    def _delete(sc):
         logger.info("Deleting StorageClass with name %s", sc.name)
         sc.delete()
+
+    _parallel_map(_delete, sc_objs)
     return True
 
 
@@ -974,20 +1242,23 @@ def delete_cephblockpools(cbp_objs):
     Returns:
         bool: True if deletion of CephBlockPool is successful
     """
-    for cbp in cbp_objs:
+
+    def _delete(cbp):
         logger.info("Deleting CephBlockPool with name %s", cbp.name)
         cbp.delete()
+
+    _parallel_map(_delete, cbp_objs)
     return True
 
 
+@ttl_cache(ttl=300, scope=_current_cluster)
 def get_cephfs_name():
     """
     Function to retrive CephFS name
     Returns:
         str: Name of CFS
     """
-    ct_pod = pod.get_ceph_tools_pod()
-    result = ct_pod.exec_ceph_cmd("ceph fs ls")
+    result = exec_ceph_cmd_on_tools_pod("ceph fs ls")
     return result[0]["name"]
 
 
@@ -1002,13 +1273,17 @@ def pull_images(image_name):
 
     """
 
-    node_objs = node.get_node_objs(node.get_worker_nodes())
-    for node_obj in node_objs:
+    def pull(node_obj):
         logging.info(f'pulling image "{image_name}  " on node {node_obj.name}')
         assert node_obj.ocp.exec_oc_debug_cmd(
             node_obj.name, cmd_list=[f"podman pull {image_name}"]
         )
 
+    # The nodes are independent, so the image is pulled on all of them
+    # concurrently
+    node_objs = node.get_node_objs(node.get_worker_nodes())
+    _parallel_map(pull, node_objs)
+
 
 def run_io_with_rados_bench(**kw):
     """
@@ -1080,13 +1355,15 @@ def get_all_pvs():
 # TODO: revert counts of tries and delay,BZ 1726266
 
 
-@retry(AssertionError, tries=20, delay=10, backoff=1)
-def validate_pv_delete(pv_name):
+def validate_pv_delete(pv_name, timeout=200):
     """
-    validates if pv is deleted after pvc deletion
+    validates if pv is deleted after pvc deletion. The pv is watched using
+    'oc wait --for=delete', which returns as soon as the pv is gone instead
+    of polling it
 
     Args:
         pv_name (str): pv from pvc to validates
+        timeout (int): Time in seconds to wait for the pv deletion
     Returns:
         bool: True if deletion is successful
 
@@ -1096,12 +1373,22 @@ def validate_pv_delete(pv_name):
     ocp_pv_obj = ocp.OCP(kind=constants.PV, namespace=defaults.ROOK_CLUSTER_NAMESPACE)
 
     try:
-        if ocp_pv_obj.get(resource_name=pv_name):
-            msg = f"{constants.PV} {pv_name} is not deleted after PVC deletion"
-            raise AssertionError(msg)
+        ocp_pv_obj.exec_oc_cmd(
+            f"wait --for=delete {constants.PV}/{pv_name} --timeout={timeout}s",
+            out_yaml_format=False,
+        )
+        return True
+    except CommandFailed as ex:
+        logger.info(f"Waiting for deletion of {constants.PV} {pv_name} failed: {ex}")
 
+    # oc wait fails on timeout, and depending on the oc version, also when the
+    # pv is already gone. Hence, the pv itself is checked once more
+    try:
+        ocp_pv_obj.get(resource_name=pv_name)
     except CommandFailed:
         return True
+    msg = f"{constants.PV} {pv_name} is not deleted after PVC deletion"
+    raise AssertionError(msg)
 
 
 def create_pods(
@@ -1116,30 +1403,35 @@ def create_pods(
         interface (int): Interface type
         pods_for_rwx (int): Number of pods to be created if access mode of
             PVC is RWX
-        status (str): If provided, wait for desired state of each pod before
-            creating next one
+        status (str): If provided, wait for desired state of each pod
         nodes (list): Node name for each pod will be selected from this list.
 
     Returns:
         list: list of Pod objects
     """
-    pod_objs = []
     nodes_iter = cycle(nodes) if nodes else None
+    # Collect the parameters of all the pods first, the pods are created
+    # concurrently afterwards
+    pods_params = []
 
     for pvc_obj in pvc_objs:
-        volume_mode = getattr(
-            pvc_obj, "volume_mode", pvc_obj.get()["spec"]["volumeMode"]
-        )
-        access_mode = getattr(pvc_obj, "access_mode", pvc_obj.get_pvc_access_mode)
+        # Fetch the PVC only when the volume mode isn't known already
+        volume_mode = getattr(pvc_obj, "volume_mode", None)
+        if volume_mode is None:
+            volume_mode = pvc_obj.get()["spec"]["volumeMode"]
+        access_mode = getattr(pvc_obj, "access_mode", None)
+        if access_mode is None:
+            access_mode = pvc_obj.get_pvc_access_mode
         if volume_mode == "Block":
             pod_dict = constants.CSI_RBD_RAW_BLOCK_POD_YAML
             raw_block_pv = True
         else:
             raw_block_pv = False
             pod_dict = ""
-        if access_mode == constants.ACCESS_MODE_RWX:
-            pod_obj_rwx = [
-                pod_factory(
+        pods_count = pods_for_rwx if access_mode == constants.ACCESS_MODE_RWX else 1
+        for _ in range(max(pods_count, 1)):
+            pods_params.append(
+                dict(
                     interface=interface,
                     pvc=pvc_obj,
                     status=status,
@@ -1147,20 +1439,9 @@ def create_pods(
                     pod_dict_path=pod_dict,
                     raw_block_pv=raw_block_pv,
                 )
-                for _ in range(1, pods_for_rwx)
-            ]
-            pod_objs.extend(pod_obj_rwx)
-        pod_obj = pod_factory(
-            interface=interface,
-            pvc=pvc_obj,
-            status=status,
-            node_name=next(nodes_iter) if nodes_iter else None,
-            pod_dict_path=pod_dict,
-            raw_block_pv=raw_block_pv,
-        )
-        pod_objs.append(pod_obj)
+            )
 
-    return pod_objs
+    return _parallel_map(lambda params: pod_factory(**params), pods_params)
 
 
 def create_build_from_docker_image(
@@ -1208,16 +1489,16 @@ def create_build_from_docker_image(
 
     docker_file = f"FROM {base_image}\n " f" RUN {cmd}\n" f"CMD tail -f /dev/null"
 
-    command = f"new-build -D $'{docker_file}' --name={image_name}"
     kubeconfig = os.getenv("KUBECONFIG")
 
-    oc_cmd = f"oc -n {namespace} "
+    oc_cmd = ["oc", "-n", namespace]
 
     if kubeconfig:
-        oc_cmd += f"--kubeconfig {kubeconfig} "
-    oc_cmd += command
-    logger.info(f"Running command {oc_cmd}")
-    result = run(oc_cmd, stdout=PIPE, stderr=PIPE, timeout=15, shell=True)
+        oc_cmd += ["--kubeconfig", kubeconfig]
+    # the arguments are passed without a shell, so the Dockerfile needs no quoting
+    oc_cmd += ["new-build", "-D", docker_file, f"--name={image_name}"]
+    logger.info(f"Running command {' '.join(oc_cmd)}")
+    result = run(oc_cmd, stdout=PIPE, stderr=PIPE, timeout=15)
     if result.stderr.decode():
         raise UnavailableBuildException(
             f"Build creation failed with error: {result.stderr.decode()}"
@@ -1265,7 +1546,77 @@ def set_image_lookup(image_name):
     return status
 
 
-def get_snapshot_time(interface, snap_name, status):
+@ttl_cache(ttl=30, scope=_current_cluster)
+def get_cached_csi_provisioner_pod(interface):
+    """
+    Get the names of the CSI provisioner pods of an interface, reusing the
+    result of a recent lookup, so the time measurement helpers don't list
+    the pods again for every PVC
+
+    Args:
+        interface (str): The interface backed the PVCs
+
+    Returns:
+        tuple: The names of the provisioner pods
+
+    """
+    return pod.get_csi_provisioner_pod(interface)
+
+
+def get_csi_provisioner_logs(interface, container="csi-provisioner", since_time=None):
+    """
+    Get the logs of a container from all the CSI provisioner pods of an
+    interface. Helpers which look for several events (e.g. start and end of
+    a PVC creation) fetch the logs once and search the same lines for all
+    of them
+
+    Args:
+        interface (str): The interface backed the PVCs
+        container (str): The name of the container to get the logs from
+        since_time (str): Get only the logs newer than this RFC3339 timestamp
+
+    Returns:
+        tuple: The lines of the logs
+
+    """
+    logs = []
+    for log_pod in get_cached_csi_provisioner_pod(interface):
+        logger.info(f"Read logs from {log_pod}")
+        logs.extend(
+            pod.get_pod_logs(log_pod, container, since_time=since_time).split("\n")
+        )
+    return tuple(logs)
+
+
+def parse_log_time(timestamp):
+    """
+    Parse a timestamp in the DATE_TIME_FORMAT format, i.e. the year followed
+    by the time from the header of a CSI log line. This is the same as
+    datetime.strptime(timestamp, DATE_TIME_FORMAT), just several times
+    faster, which matters when parsing the times of thousands of PVCs
+
+    Args:
+        timestamp (str): The timestamp, e.g. 2021 I0521 10:11:12.123456
+
+    Returns:
+        datetime object: The parsed time
+
+    """
+    year, day, time_of_day = timestamp.split(" ")
+    hms, _, fraction = time_of_day.partition(".")
+    hours, minutes, seconds = hms.split(":")
+    return datetime.datetime(
+        int(year),
+        int(day[1:3]),
+        int(day[3:5]),
+        int(hours),
+        int(minutes),
+        int(seconds),
+        int(fraction.ljust(6, "0")),
+    )
+
+
+def get_snapshot_time(interface, snap_name, status, since_time=None):
     """
     Get the starting/ending creation time of a PVC based on provisioner logs
 
@@ -1286,33 +1637,42 @@ def get_snapshot_time(interface, snap_name, status):
         pvc_name (str / list): Name of the PVC(s) for creation time
                                the list will be list of pvc objects
         status (str): the status that we want to get - Start / End
+        since_time (str): Read only the logs newer than this RFC3339 timestamp
 
     Returns:
         datetime object: Time of PVC(s) creation
 
     """
 
-    def get_pattern_time(log, snapname, pattern):
+    def get_pattern_times(log, snapnames, pattern):
         """
-        Get the time of pattern in the log
+        Get the times of pattern in the log for several snapshots, in a
+        single pass over the log
 
         Args:
             log (list): list of all lines in the log file
-            snapname (str): the name of the snapshot
+            snapnames (list): the names of the snapshots
             pattern (str): the pattern that need to be found in the log (start / bound)
 
         Returns:
-            str: string of the pattern timestamp in the log, if not found None
+            dict: the snapshot names as keys and the strings of the first
+                pattern timestamp in the log as values, names which were
+                not found are missing
 
         """
         this_year = str(datetime.datetime.now().year)
+        remaining = set(snapnames)
+        times = {}
         for line in log:
-            if re.search(snapname, line) and re.search(pattern, line):
+            if pattern not in line:
+                continue
+            for snapname in [name for name in remaining if name in line]:
                 mon_day = " ".join(line.split(" ")[0:2])
-                return f"{this_year} {mon_day}"
-        return None
-
-    logs = ""
+                times[snapname] = f"{this_year} {mon_day}"
+                remaining.discard(snapname)
+            if not remaining:
+                break
+        return times
 
     # the starting and ending time are taken from different logs,
     # the start creation time is taken from the snapshot controller, while
@@ -1322,72 +1682,86 @@ def get_snapshot_time(interface, snap_name, status):
         # Get the snapshoter-controller pod
         pod_name = pod.get_csi_snapshoter_pod()
         logs = pod.get_pod_logs(
-            pod_name, namespace="openshift-cluster-storage-operator"
-        )
+            pod_name,
+            namespace="openshift-cluster-storage-operator",
+            since_time=since_time,
+        ).split("\n")
     elif status.lower() == "end":
         pattern = "readyToUse true"
-        pod_name = pod.get_csi_provisioner_pod(interface)
-        # get the logs from the csi-provisioner containers
-        for log_pod in pod_name:
-            logs += pod.get_pod_logs(log_pod, "csi-snapshotter")
+        # get the logs from the csi-snapshotter containers
+        logs = get_csi_provisioner_logs(interface, "csi-snapshotter", since_time)
     else:
         logger.error(f"the status {status} is invalid.")
         return None
 
-    logs = logs.split("\n")
-
     stat = None
     # Extract the time for the one PVC snapshot provisioning
     if isinstance(snap_name, str):
-        stat = get_pattern_time(logs, snap_name, pattern)
+        stat = get_pattern_times(logs, [snap_name], pattern).get(snap_name)
     # Extract the time for the list of PVCs snapshot provisioning
     if isinstance(snap_name, list):
-        all_stats = []
-        for snapname in snap_name:
-            all_stats.append(get_pattern_time(logs, snapname.name, pattern))
-        all_stats = sorted(all_stats)
-        if status.lower() == "end":
-            stat = all_stats[-1]  # return the highest time
-        elif status.lower() == "start":
-            stat = all_stats[0]  # return the lowest time
+        snapnames = [snapname.name for snapname in snap_name]
+        times = get_pattern_times(logs, snapnames, pattern)
+        if len(times) == len(set(snapnames)):
+            # return the highest time for the end, the lowest one for the start
+            aggregate = max if status.lower() == "end" else min
+            stat = aggregate(times.values())
+        else:
+            logger.error(
+                f"{pattern} not found in the logs for {set(snapnames) - set(times)}"
+            )
     if stat:
-        return datetime.datetime.strptime(stat, DATE_TIME_FORMAT)
+        return parse_log_time(stat)
     else:
         return None
 
 
-def measure_snapshot_creation_time(interface, snap_name, snap_con_name, snap_uid=None):
+def measure_snapshot_creation_time(
+    interface, snap_name, snap_con_name, snap_uid=None, snap_namespace=None
+):
     """
     Measure Snapshot creation time based on logs
 
     Args:
         snap_name (str): Name of the snapshot for creation time measurement
+        snap_namespace (str): Namespace of the snapshot, if not given it is
+            read from the snapshot content
 
     Returns:
         float: Creation time for the snapshot
 
     """
-    start = get_snapshot_time(interface, snap_name, status="start")
-    end = get_snapshot_time(interface, snap_con_name, status="end")
-    logs = ""
+    if not snap_namespace:
+        content = ocp.OCP(kind=constants.VOLUMESNAPSHOTCONTENT).get(
+            resource_name=snap_con_name
+        )
+        snap_namespace = content["spec"]["volumeSnapshotRef"]["namespace"]
+    # The snapshot events are logged after the snapshot is created, so the
+    # older logs are not needed, the margin covers a clock skew
+    snapshot = ocp.OCP(kind=constants.VOLUMESNAPSHOT, namespace=snap_namespace).get(
+        resource_name=snap_name
+    )
+    created = datetime.datetime.strptime(
+        snapshot["metadata"]["creationTimestamp"], "%Y-%m-%dT%H:%M:%SZ"
+    )
+    since_time = (created - datetime.timedelta(seconds=10)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+    start = get_snapshot_time(
+        interface, snap_name, status="start", since_time=since_time
+    )
+    end = get_snapshot_time(
+        interface, snap_con_name, status="end", since_time=since_time
+    )
     if start and end:
         total = end - start
         return total.total_seconds()
     else:
         # at 4.8 the log messages was changed, so need different parsing
-        pod_name = pod.get_csi_provisioner_pod(interface)
-        # get the logs from the csi-provisioner containers
-        for log_pod in pod_name:
-            logger.info(f"Read logs from {log_pod}")
-            logs += pod.get_pod_logs(log_pod, "csi-snapshotter")
-        logs = logs.split("\n")
+        logs = get_csi_provisioner_logs(interface, "csi-snapshotter", since_time)
         pattern = "CSI CreateSnapshot: snapshot-"
         for line in logs:
-            if (
-                re.search(snap_uid, line)
-                and re.search(pattern, line)
-                and re.search("readyToUse \\[true\\]", line)
-            ):
+            if pattern in line and snap_uid in line and "readyToUse [true]" in line:
                 # The creation time log is in nanosecond, so, it need to convert to seconds.
                 results = int(line.split()[-5].split(":")[1].replace("]", "")) * (
                     10 ** -9
@@ -1397,6 +1771,34 @@ def measure_snapshot_creation_time(interface, snap_name, snap_con_name, snap_uid
         return None
 
 
+def get_csi_log_event_time(logs, name, action, status, latest=False):
+    """
+    Get the time of a CSI provisioner event of a PVC / PV from the logs
+
+    Args:
+        logs (tuple): The lines of the CSI provisioner logs
+        name (str): Name of the PVC (provision) or of the PV (delete)
+        action (str): The event action - provision / delete
+        status (str): The event status - started / succeeded
+        latest (bool): Take the last occurrence of the event in the logs
+            instead of the first one
+
+    Returns:
+        datetime object: Time of the event
+
+    """
+    templates = {
+        "provision": "provision.*{name}.*{status}",
+        "delete": 'delete "{name}": {status}',
+    }
+    pattern = re.compile(templates[action].format(name=name, status=status))
+    lines = [line for line in logs if name in line and pattern.search(line)]
+    line = lines[-1] if latest else lines[0]
+    this_year = str(datetime.datetime.now().year)
+    mon_day = " ".join(line.split(" ")[0:2])
+    return parse_log_time(f"{this_year} {mon_day}")
+
+
 def get_provision_time(interface, pvc_name, status="start"):
     """
     Get the starting/ending creation time of a PVC based on provisioner logs
@@ -1416,34 +1818,18 @@ def get_provision_time(interface, pvc_name, status="start"):
     if status.lower() == "end":
         operation = "succeeded"
 
-    this_year = str(datetime.datetime.now().year)
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
     # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
+    logs = get_csi_provisioner_logs(interface)
     # Extract the time for the one PVC provisioning
     if isinstance(pvc_name, str):
-        stat = [i for i in logs if re.search(f"provision.*{pvc_name}.*{operation}", i)]
-        mon_day = " ".join(stat[0].split(" ")[0:2])
-        stat = f"{this_year} {mon_day}"
+        return get_csi_log_event_time(logs, pvc_name, "provision", operation)
     # Extract the time for the list of PVCs provisioning
-    if isinstance(pvc_name, list):
-        all_stats = []
-        for i in range(0, len(pvc_name)):
-            name = pvc_name[i].name
-            stat = [i for i in logs if re.search(f"provision.*{name}.*{operation}", i)]
-            mon_day = " ".join(stat[0].split(" ")[0:2])
-            stat = f"{this_year} {mon_day}"
-            all_stats.append(stat)
-        all_stats = sorted(all_stats)
-        if status.lower() == "end":
-            stat = all_stats[-1]  # return the highest time
-        elif status.lower() == "start":
-            stat = all_stats[0]  # return the lowest time
-    return datetime.datetime.strptime(stat, DATE_TIME_FORMAT)
+    # return the highest time for the end, the lowest one for the start
+    aggregate = max if status.lower() == "end" else min
+    return aggregate(
+        get_csi_log_event_time(logs, obj.name, "provision", operation)
+        for obj in pvc_name
+    )
 
 
 def get_start_creation_time(interface, pvc_name):
@@ -1458,19 +1844,9 @@ def get_start_creation_time(interface, pvc_name):
         datetime object: Start time of PVC creation
 
     """
-    this_year = str(datetime.datetime.now().year)
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
-    # Extract the starting time for the PVC provisioning
-    start = [i for i in logs if re.search(f"provision.*{pvc_name}.*started", i)]
-    mon_day = " ".join(start[0].split(" ")[0:2])
-    start = f"{this_year} {mon_day}"
-    return datetime.datetime.strptime(start, DATE_TIME_FORMAT)
+    return get_csi_log_event_time(
+        get_csi_provisioner_logs(interface), pvc_name, "provision", "started"
+    )
 
 
 def get_end_creation_time(interface, pvc_name):
@@ -1485,20 +1861,14 @@ def get_end_creation_time(interface, pvc_name):
         datetime object: End time of PVC creation
 
     """
-    this_year = str(datetime.datetime.now().year)
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
-    # Extract the starting time for the PVC provisioning
-    end = [i for i in logs if re.search(f"provision.*{pvc_name}.*succeeded", i)]
     # End provisioning string may appear in logs several times, take here the latest one
-    mon_day = " ".join(end[-1].split(" ")[0:2])
-    end = f"{this_year} {mon_day}"
-    return datetime.datetime.strptime(end, DATE_TIME_FORMAT)
+    return get_csi_log_event_time(
+        get_csi_provisioner_logs(interface),
+        pvc_name,
+        "provision",
+        "succeeded",
+        latest=True,
+    )
 
 
 def measure_pvc_creation_time(interface, pvc_name):
@@ -1511,12 +1881,88 @@ def measure_pvc_creation_time(interface, pvc_name):
         float: Creation time for the PVC
 
     """
-    start = get_start_creation_time(interface=interface, pvc_name=pvc_name)
-    end = get_end_creation_time(interface=interface, pvc_name=pvc_name)
+    logs = get_csi_provisioner_logs(interface)
+    start = get_csi_log_event_time(logs, pvc_name, "provision", "started")
+    # End provisioning string may appear in logs several times, take here the latest one
+    end = get_csi_log_event_time(logs, pvc_name, "provision", "succeeded", latest=True)
     total = end - start
     return total.total_seconds()
 
 
+def follow_csi_provisioner_logs(interface, timeout, container="csi-provisioner"):
+    """
+    Follow the logs of a container from all the CSI provisioner pods of an
+    interface, yielding the existing lines first and then the new ones as
+    they are logged, until the timeout expires
+
+    Args:
+        interface (str): The interface backed the PVCs
+        timeout (int): Time in seconds after which to stop following the logs
+        container (str): The name of the container to get the logs from
+
+    Yields:
+        str: The lines of the logs
+
+    Raises:
+        CommandFailed: In case the logs of one of the pods can't be followed
+
+    """
+    try:
+        yield from OCP(
+            kind=constants.POD, namespace=defaults.ROOK_CLUSTER_NAMESPACE
+        ).follow_oc_cmds(
+            [
+                f"logs -f {log_pod} -c {container}"
+                for log_pod in get_cached_csi_provisioner_pod(interface)
+            ],
+            timeout=timeout,
+        )
+    except CommandFailed:
+        # the cached provisioner pods may have been replaced in the meantime
+        get_cached_csi_provisioner_pod.cache_clear()
+        raise
+
+
+def get_csi_log_events(logs, pattern, names, marker=None, until=None):
+    """
+    Find the timestamps of the CSI provisioner events of many resources in
+    a single pass over the logs
+
+    Args:
+        logs (iterable): The lines of the CSI provisioner logs
+        pattern (re.Pattern): Compiled pattern which captures the name of
+            the resource and the event (e.g. started / succeeded)
+        names (list): Names of the resources to look for
+        marker (str): Optional substring which every matching line contains,
+            lines without it are skipped before running the pattern
+        until (tuple): Optional events (e.g. started, succeeded), once all of
+            them are found for every resource, the rest of the logs is not
+            read, which allows to pass logs which are being followed
+
+    Returns:
+        dict: The resource names as keys and dictionaries of the event
+            timestamps (as they appear in the logs) keyed by the event as
+            values. Only the first occurrence of each event is kept
+
+    """
+    names = set(names)
+    events = {name: {} for name in names}
+    incomplete = set(names) if until else None
+    for line in logs:
+        if marker and marker not in line:
+            continue
+        match = pattern.search(line)
+        if match and match.group(1) in names:
+            events[match.group(1)].setdefault(
+                match.group(2), " ".join(line.split(" ")[0:2])
+            )
+            if until and all(event in events[match.group(1)] for event in until):
+                incomplete.discard(match.group(1))
+                if not incomplete:
+                    break
+    return events
+
+
 def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
     """
     Measure PVC creation time of bulk PVC based on logs.
@@ -1524,62 +1970,44 @@ def measure_pvc_creation_time_bulk(interface, pvc_name_list, wait_time=60):
     Args:
         interface (str): The interface backed the PVC
         pvc_name_list (list): List of PVC Names for measuring creation time
-        wait_time (int): Seconds to wait before collecting CSI log
+        wait_time (int): The CSI logs are followed for up to 7 times this
+            number of seconds
 
     Returns:
         pvc_dict (dict): Dictionary of pvc_name with creation time.
 
     """
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # due to some delay in CSI log generation added wait
-    time.sleep(wait_time)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-    logs = logs.split("\n")
-
-    loop_counter = 0
-    while True:
-        no_data_list = list()
-        for name in pvc_name_list:
-            # check if PV data present in CSI logs
-            start = [i for i in logs if re.search(f"provision.*{name}.*started", i)]
-            end = [i for i in logs if re.search(f"provision.*{name}.*succeeded", i)]
-            if not start or not end:
-                no_data_list.append(name)
-
-        if no_data_list:
-            # Clear and get CSI logs after 60secs
-            logging.info(f"PVC count without CSI create log data {len(no_data_list)}")
-            logs.clear()
-            time.sleep(wait_time)
-            logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-            logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-            logs = logs.split("\n")
-            loop_counter += 1
-            if loop_counter >= 6:
-                logging.info("Waited for more than 6mins still no data")
-                raise UnexpectedBehaviour(
-                    f"There is no pvc creation data in CSI logs for {no_data_list}"
-                )
-            continue
-        else:
-            break
+    # follow the csi-provisioner logs until all the PVCs are found in them,
+    # for at most the time the logs used to be polled for (7 * wait_time)
+    with closing(follow_csi_provisioner_logs(interface, timeout=wait_time * 7)) as logs:
+        events = get_csi_log_events(
+            logs,
+            PVC_PROVISION_LOG_PATTERN,
+            pvc_name_list,
+            marker="provision",
+            until=("started", "succeeded"),
+        )
+    # check if PV data present in CSI logs
+    no_data_list = [
+        name
+        for name in pvc_name_list
+        if "started" not in events[name] or "succeeded" not in events[name]
+    ]
+    if no_data_list:
+        logging.info(f"PVC count without CSI create log data {len(no_data_list)}")
+        raise UnexpectedBehaviour(
+            f"There is no pvc creation data in CSI logs for {no_data_list}"
+        )
 
     pvc_dict = dict()
     this_year = str(datetime.datetime.now().year)
     for pvc_name in pvc_name_list:
         # Extract the starting time for the PVC provisioning
-        start = [i for i in logs if re.search(f"provision.*{pvc_name}.*started", i)]
-        mon_day = " ".join(start[0].split(" ")[0:2])
-        start = f"{this_year} {mon_day}"
-        start_time = datetime.datetime.strptime(start, DATE_TIME_FORMAT)
+        start = f"{this_year} {events[pvc_name]['started']}"
+        start_time = parse_log_time(start)
         # Extract the end time for the PVC provisioning
-        end = [i for i in logs if re.search(f"provision.*{pvc_name}.*succeeded", i)]
-        mon_day = " ".join(end[0].split(" ")[0:2])
-        end = f"{this_year} {mon_day}"
-        end_time = datetime.datetime.strptime(end, DATE_TIME_FORMAT)
+        end = f"{this_year} {events[pvc_name]['succeeded']}"
+        end_time = parse_log_time(end)
         total = end_time - start_time
         pvc_dict[pvc_name] = total.total_seconds()
 
@@ -1595,7 +2023,8 @@ def measure_pv_deletion_time_bulk(
     Args:
         interface (str): The interface backed the PV
         pv_name_list (list): List of PV Names for measuring deletion time
-        wait_time (int): Seconds to wait before collecting CSI log
+        wait_time (int): The CSI logs are followed for up to 7 times this
+            number of seconds
         return_log_times (bool): Determines the return value -- if False, dictionary of pv_names with the deletion time
                 is returned; if True -- the dictionary of pv_names with the tuple of (srart_deletion_time,
                 end_deletion_time) is returned
@@ -1606,56 +2035,37 @@ def measure_pv_deletion_time_bulk(
                 is False) or a tuple of (start_deletion_time, end_deletion_time) as they appear in the logs
 
     """
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # due to some delay in CSI log generation added wait
-    time.sleep(wait_time)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-    logs = logs.split("\n")
-
-    loop_counter = 0
-    while True:
-        no_data_list = list()
-        for pv in pv_name_list:
-            # check if PV data present in CSI logs
-            start = [i for i in logs if re.search(f'delete "{pv}": started', i)]
-            end = [i for i in logs if re.search(f'delete "{pv}": succeeded', i)]
-            if not start or not end:
-                no_data_list.append(pv)
-
-        if no_data_list:
-            # Clear and get CSI logs after 60secs
-            logging.info(f"PV count without CSI delete log data {len(no_data_list)}")
-            logs.clear()
-            time.sleep(wait_time)
-            logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-            logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-            logs = logs.split("\n")
-            loop_counter += 1
-            if loop_counter >= 6:
-                logging.info("Waited for more than 6mins still no data")
-                raise UnexpectedBehaviour(
-                    f"There is no pv deletion data in CSI logs for {no_data_list}"
-                )
-            continue
-        else:
-            break
+    # follow the csi-provisioner logs until all the PVs are found in them,
+    # for at most the time the logs used to be polled for (7 * wait_time)
+    with closing(follow_csi_provisioner_logs(interface, timeout=wait_time * 7)) as logs:
+        events = get_csi_log_events(
+            logs,
+            PV_DELETE_LOG_PATTERN,
+            pv_name_list,
+            marker="delete",
+            until=("started", "succeeded"),
+        )
+    # check if PV data present in CSI logs
+    no_data_list = [
+        pv
+        for pv in pv_name_list
+        if "started" not in events[pv] or "succeeded" not in events[pv]
+    ]
+    if no_data_list:
+        logging.info(f"PV count without CSI delete log data {len(no_data_list)}")
+        raise UnexpectedBehaviour(
+            f"There is no pv deletion data in CSI logs for {no_data_list}"
+        )
 
     pv_dict = dict()
     this_year = str(datetime.datetime.now().year)
     for pv_name in pv_name_list:
         # Extract the deletion start time for the PV
-        start = [i for i in logs if re.search(f'delete "{pv_name}": started', i)]
-        mon_day = " ".join(start[0].split(" ")[0:2])
-        start_tm = f"{this_year} {mon_day}"
-        start_time = datetime.datetime.strptime(start_tm, DATE_TIME_FORMAT)
+        start_tm = f"{this_year} {events[pv_name]['started']}"
+        start_time = parse_log_time(start_tm)
         # Extract the deletion end time for the PV
-        end = [i for i in logs if re.search(f'delete "{pv_name}": succeeded', i)]
-        mon_day = " ".join(end[0].split(" ")[0:2])
-        end_tm = f"{this_year} {mon_day}"
-        end_time = datetime.datetime.strptime(end_tm, DATE_TIME_FORMAT)
+        end_tm = f"{this_year} {events[pv_name]['succeeded']}"
+        end_time = parse_log_time(end_tm)
         total = end_time - start_time
         if not return_log_times:
             pv_dict[pv_name] = total.total_seconds()
@@ -1677,19 +2087,9 @@ def get_start_deletion_time(interface, pv_name):
         datetime object: Start time of PVC deletion
 
     """
-    this_year = str(datetime.datetime.now().year)
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
-    # Extract the starting time for the PVC deletion
-    start = [i for i in logs if re.search(f'delete "{pv_name}": started', i)]
-    mon_day = " ".join(start[0].split(" ")[0:2])
-    start = f"{this_year} {mon_day}"
-    return datetime.datetime.strptime(start, DATE_TIME_FORMAT)
+    return get_csi_log_event_time(
+        get_csi_provisioner_logs(interface), pv_name, "delete", "started"
+    )
 
 
 def get_end_deletion_time(interface, pv_name):
@@ -1704,19 +2104,9 @@ def get_end_deletion_time(interface, pv_name):
         datetime object: End time of PVC deletion
 
     """
-    this_year = str(datetime.datetime.now().year)
-    # Get the correct provisioner pod based on the interface
-    pod_name = pod.get_csi_provisioner_pod(interface)
-    # get the logs from the csi-provisioner containers
-    logs = pod.get_pod_logs(pod_name[0], "csi-provisioner")
-    logs += pod.get_pod_logs(pod_name[1], "csi-provisioner")
-
-    logs = logs.split("\n")
-    # Extract the starting time for the PV deletion
-    end = [i for i in logs if re.search(f'delete "{pv_name}": succeeded', i)]
-    mon_day = " ".join(end[0].split(" ")[0:2])
-    end = f"{this_year} {mon_day}"
-    return datetime.datetime.strptime(end, DATE_TIME_FORMAT)
+    return get_csi_log_event_time(
+        get_csi_provisioner_logs(interface), pv_name, "delete", "succeeded"
+    )
 
 
 def measure_pvc_deletion_time(interface, pv_name):
@@ -1731,8 +2121,9 @@ def measure_pvc_deletion_time(interface, pv_name):
         float: Deletion time for the PVC
 
     """
-    start = get_start_deletion_time(interface=interface, pv_name=pv_name)
-    end = get_end_deletion_time(interface=interface, pv_name=pv_name)
+    logs = get_csi_provisioner_logs(interface)
+    start = get_csi_log_event_time(logs, pv_name, "delete", "started")
+    end = get_csi_log_event_time(logs, pv_name, "delete", "succeeded")
     total = end - start
     return total.total_seconds()
 
@@ -1754,17 +2145,15 @@ def pod_start_time(pod_obj):
     """
     time_format = "%Y-%m-%dT%H:%M:%SZ"
     containers_start_time = {}
-    start_time = pod_obj.data["status"]["startTime"]
-    start_time = datetime.datetime.strptime(start_time, time_format)
-    for container in range(len(pod_obj.data["status"]["containerStatuses"])):
-        started_time = pod_obj.data["status"]["containerStatuses"][container]["state"][
-            "running"
-        ]["startedAt"]
-        started_time = datetime.datetime.strptime(started_time, time_format)
-        container_name = pod_obj.data["status"]["containerStatuses"][container]["name"]
+    status = pod_obj.data["status"]
+    start_time = datetime.datetime.strptime(status["startTime"], time_format)
+    for container_status in status["containerStatuses"]:
+        started_time = datetime.datetime.strptime(
+            container_status["state"]["running"]["startedAt"], time_format
+        )
         container_start_time = (started_time - start_time).seconds
-        containers_start_time[container_name] = container_start_time
-        return containers_start_time
+        containers_start_time[container_status["name"]] = container_start_time
+    return containers_start_time
 
 
 def get_default_storage_class():
@@ -1803,28 +2192,55 @@ def change_default_storageclass(scname):
     """
     default_sc = get_default_storage_class()
     ocp_obj = ocp.OCP(kind="StorageClass")
-    if default_sc:
-        # Change the existing default Storageclass annotation to false
-        for sc in default_sc:
-            patch = (
-                ' \'{"metadata": {"annotations":'
-                '{"storageclass.kubernetes.io/is-default-class"'
-                ':"false"}}}\' '
+    annotation = "storageclass.kubernetes.io/is-default-class"
+    old_default_sc = [sc for sc in default_sc if sc != scname]
+    if old_default_sc:
+        # Change the existing default Storageclass(es) annotation to false
+        ocp_obj.exec_oc_cmd(
+            command=(
+                f"annotate storageclass {' '.join(old_default_sc)} "
+                f"{annotation}=false --overwrite"
             )
-            patch_cmd = f"patch storageclass {sc} -p" + patch
-            ocp_obj.exec_oc_cmd(command=patch_cmd)
+        )
 
     # Change the new storageclass to default
-    patch = (
-        ' \'{"metadata": {"annotations":'
-        '{"storageclass.kubernetes.io/is-default-class"'
-        ':"true"}}}\' '
-    )
-    patch_cmd = f"patch storageclass {scname} -p" + patch
-    ocp_obj.exec_oc_cmd(command=patch_cmd)
+    if scname not in default_sc:
+        ocp_obj.exec_oc_cmd(
+            command=f"annotate storageclass {scname} {annotation}=true --overwrite"
+        )
     return True
 
 
+def list_backend_volumes(interface, pool_name=None):
+    """
+    List the names of the images / subvolumes in the backend, so presence of
+    many volumes can be checked with a single command. The listing is not
+    cached, since CSI creates and deletes the volumes at any time
+
+    Args:
+        interface (str): The interface backed the PVC
+        pool_name (str): Name of the rbd-pool if interface is CephBlockPool
+
+    Returns:
+        frozenset: Names of the volumes, e.g. csi-vol-<uuid>
+
+    Raises:
+        UnexpectedBehaviour: In case of unsupported interface
+
+    """
+    if interface == constants.CEPHBLOCKPOOL:
+        cmd = f"rbd ls -p {pool_name}"
+    elif interface == constants.CEPHFILESYSTEM:
+        cmd = f"ceph fs subvolume ls {get_cephfs_name()} csi"
+    else:
+        raise UnexpectedBehaviour(f"Unsupported interface {interface}")
+    out = exec_ceph_cmd_on_tools_pod(cmd, format="json")
+    # rbd lists the image names, ceph fs lists dictionaries with the names
+    return frozenset(
+        volume["name"] if isinstance(volume, dict) else volume for volume in out
+    )
+
+
 def is_volume_present_in_backend(interface, image_uuid, pool_name=None):
     """
     Check whether Image/Subvolume is present in the backend.
@@ -1843,37 +2259,15 @@ def is_volume_present_in_backend(interface, image_uuid, pool_name=None):
         bool: True if volume is present and False if volume is not present
 
     """
-    cmd = ""
-    valid_error = []
-    ct_pod = pod.get_ceph_tools_pod()
-    if interface == constants.CEPHBLOCKPOOL:
-        valid_error = [f"error opening image csi-vol-{image_uuid}"]
-        cmd = f"rbd info -p {pool_name} csi-vol-{image_uuid}"
-    if interface == constants.CEPHFILESYSTEM:
-        valid_error = [
-            f"Subvolume 'csi-vol-{image_uuid}' not found",
-            f"subvolume 'csi-vol-{image_uuid}' does not exist",
-        ]
-        cmd = (
-            f"ceph fs subvolume getpath {get_cephfs_name()}"
-            f" csi-vol-{image_uuid} csi"
-        )
-
-    try:
-        ct_pod.exec_ceph_cmd(ceph_cmd=cmd, format="json")
+    if f"csi-vol-{image_uuid}" in list_backend_volumes(interface, pool_name):
         logger.info(
             f"Verified: Volume corresponding to uuid {image_uuid} exists " f"in backend"
         )
         return True
-    except CommandFailed as ecf:
-        assert any([error in str(ecf) for error in valid_error]), (
-            f"Error occurred while verifying volume is present in backend: "
-            f"{str(ecf)} ImageUUID: {image_uuid}. Interface type: {interface}"
-        )
-        logger.info(
-            f"Volume corresponding to uuid {image_uuid} does not exist " f"in backend"
-        )
-        return False
+    logger.info(
+        f"Volume corresponding to uuid {image_uuid} does not exist " f"in backend"
+    )
+    return False
 
 
 def verify_volume_deleted_in_backend(
@@ -1897,15 +2291,19 @@ def verify_volume_deleted_in_backend(
         bool: True if volume is deleted before timeout.
             False if volume is not deleted.
     """
+    sampler = TimeoutSampler(
+        timeout,
+        2,
+        is_volume_present_in_backend,
+        interface=interface,
+        image_uuid=image_uuid,
+        pool_name=pool_name,
+    )
+    # Back off, so a slow deletion doesn't keep listing volumes every 2s
+    sampler.backoff_factor = 2
+    sampler.max_sleep = 16
     try:
-        for ret in TimeoutSampler(
-            timeout,
-            2,
-            is_volume_present_in_backend,
-            interface=interface,
-            image_uuid=image_uuid,
-            pool_name=pool_name,
-        ):
+        for ret in sampler:
             if not ret:
                 break
         logger.info(
@@ -1918,13 +2316,12 @@ def verify_volume_deleted_in_backend(
             f"Volume corresponding to uuid {image_uuid} is not deleted " f"in backend"
         )
         # Log 'ceph progress' and 'ceph rbd task list' for debugging purpose
-        ct_pod = pod.get_ceph_tools_pod()
-        ct_pod.exec_ceph_cmd("ceph progress json", format=None)
-        ct_pod.exec_ceph_cmd("ceph rbd task list")
+        exec_ceph_cmd_on_tools_pod("ceph progress json", format=None)
+        exec_ceph_cmd_on_tools_pod("ceph rbd task list")
         return False
 
 
-def delete_volume_in_backend(img_uuid, pool_name=None):
+def delete_volume_in_backend(img_uuid, pool_name=None, verify=True):
     """
     Delete an Image/Subvolume in the backend
 
@@ -1936,6 +2333,8 @@ def delete_volume_in_backend(img_uuid, pool_name=None):
             ``0001-000c-rook-cluster-0000000000000001-f301898c-a192-11e9-852a-1eeeb6975c91``
             where image_uuid is ``f301898c-a192-11e9-852a-1eeeb6975c91``
          pool_name (str): The of the pool
+         verify (bool): True to verify the image is gone from the backend
+            after the deletion, False to rely on the delete command only
 
     Returns:
          bool: True if image deleted successfully
@@ -1945,8 +2344,6 @@ def delete_volume_in_backend(img_uuid, pool_name=None):
                 image not deleted
 
     """
-    cmd = ""
-    valid_error = []
     pool_cr = get_pool_cr(pool_name)
     if pool_cr is not None:
         if pool_cr["kind"] == "CephFilesystem":
@@ -1962,51 +2359,51 @@ def delete_volume_in_backend(img_uuid, pool_name=None):
         )
         return False
 
-    # Checking if image is present before trying to delete
-    image_present_results = is_volume_present_in_backend(
-        interface=interface, image_uuid=img_uuid, pool_name=pool_name
-    )
-
-    # Incase image is present delete
-    if image_present_results:
-        if interface == constants.CEPHBLOCKPOOL:
-            logger.info(
-                f"Trying to delete image csi-vol-{img_uuid} from pool {pool_name}"
-            )
-            valid_error = ["No such file or directory"]
-            cmd = f"rbd rm -p {pool_name} csi-vol-{img_uuid}"
+    if interface == constants.CEPHBLOCKPOOL:
+        valid_errors = ["No such file or directory"]
+        cmd = f"rbd rm -p {pool_name} csi-vol-{img_uuid}"
+    elif interface == constants.CEPHFILESYSTEM:
+        valid_errors = [
+            f"Subvolume 'csi-vol-{img_uuid}' not found",
+            f"subvolume 'csi-vol-{img_uuid}' does not exist",
+        ]
+        cmd = f"ceph fs subvolume rm {get_cephfs_name()} csi-vol-{img_uuid} csi"
+    else:
+        logger.info(f"Unsupported interface {interface} of pool {pool_name}")
+        return False
 
-        if interface == constants.CEPHFILESYSTEM:
+    # The delete command fails with a known error if the image is not
+    # present, so there is no need to check its presence beforehand
+    logger.info(f"Trying to delete image csi-vol-{img_uuid} from pool {pool_name}")
+    try:
+        exec_ceph_cmd_on_tools_pod(cmd, format=None)
+    except CommandFailed as ecf:
+        valid_error = re.compile("|".join(map(re.escape, valid_errors)))
+        if valid_error.search(str(ecf)):
             logger.info(
-                f"Trying to delete image csi-vol-{img_uuid} from pool {pool_name}"
+                f"Image csi-vol-{img_uuid} is not present in backend: "
+                f"{str(ecf)} Interface type: {interface}"
             )
-            valid_error = [
-                f"Subvolume 'csi-vol-{img_uuid}' not found",
-                f"subvolume 'csi-vol-{img_uuid}' does not exist",
-            ]
-            cmd = f"ceph fs subvolume rm {get_cephfs_name()} csi-vol-{img_uuid} csi"
+            return False
+        logger.warning(f"Failed to delete image csi-vol-{img_uuid}: {str(ecf)}")
+        if not verify:
+            return False
 
-        ct_pod = pod.get_ceph_tools_pod()
-        try:
-            ct_pod.exec_ceph_cmd(ceph_cmd=cmd, format=None)
-        except CommandFailed as ecf:
-            if any([error in str(ecf) for error in valid_error]):
-                logger.info(
-                    f"Error occurred while verifying volume is present in backend: "
-                    f"{str(ecf)} ImageUUID: {img_uuid}. Interface type: {interface}"
-                )
-                return False
+    if not verify:
+        logger.info(f"Image csi-vol-{img_uuid} deleted")
+        return True
 
-        verify_img_delete_result = is_volume_present_in_backend(
-            interface=interface, image_uuid=img_uuid, pool_name=pool_name
-        )
-        if not verify_img_delete_result:
-            logger.info(f"Image csi-vol-{img_uuid} deleted successfully")
-            return True
-        else:
-            logger.info(f"Image csi-vol-{img_uuid} not deleted successfully")
-            return False
-    return False
+    verify_img_delete_result = is_volume_present_in_backend(
+        interface=interface,
+        image_uuid=img_uuid,
+        pool_name=pool_name,
+    )
+    if not verify_img_delete_result:
+        logger.info(f"Image csi-vol-{img_uuid} deleted successfully")
+        return True
+    else:
+        logger.info(f"Image csi-vol-{img_uuid} not deleted successfully")
+        return False
 
 
 def create_serviceaccount(namespace):
@@ -2020,7 +2417,7 @@ def create_serviceaccount(namespace):
         OCS: An OCS instance for the service_account
     """
 
-    service_account_data = templating.load_yaml(constants.SERVICE_ACCOUNT_YAML)
+    service_account_data = load_yaml_template(constants.SERVICE_ACCOUNT_YAML)
     service_account_data["metadata"]["name"] = create_unique_resource_name(
         "sa", "serviceaccount"
     )
@@ -2065,11 +2462,8 @@ def validate_scc_policy(sa_name, namespace, scc_name=constants.PRIVILEGED):
     logger.info(sa_name)
     ocp_scc_obj = ocp.OCP(kind=constants.SCC, namespace=namespace)
     scc_dict = ocp_scc_obj.get(resource_name=scc_name)
-    scc_users_list = scc_dict.get("users")
-    for scc_user in scc_users_list:
-        if scc_user == sa_name:
-            return True
-    return False
+    # SCC without any user has no users field at all
+    return sa_name in (scc_dict.get("users") or [])
 
 
 def add_scc_policy(sa_name, namespace):
@@ -2083,11 +2477,15 @@ def add_scc_policy(sa_name, namespace):
     """
     ocp = OCP()
     scc_list = [constants.ANYUID, constants.PRIVILEGED]
-    for scc in scc_list:
-        out = ocp.exec_oc_cmd(
+
+    def exec_policy_cmd(scc):
+        return ocp.exec_oc_cmd(
             command=f"adm policy add-scc-to-user {scc} system:serviceaccount:{namespace}:{sa_name}",
             out_yaml_format=False,
         )
+
+    # The SCCs are independent, run the oc commands for them concurrently
+    for out in _parallel_map(exec_policy_cmd, scc_list):
         logger.info(out)
 
 
@@ -2102,14 +2500,45 @@ def remove_scc_policy(sa_name, namespace):
     """
     ocp = OCP()
     scc_list = [constants.ANYUID, constants.PRIVILEGED]
-    for scc in scc_list:
-        out = ocp.exec_oc_cmd(
+
+    def exec_policy_cmd(scc):
+        return ocp.exec_oc_cmd(
             command=f"adm policy remove-scc-from-user {scc} system:serviceaccount:{namespace}:{sa_name}",
             out_yaml_format=False,
         )
+
+    # The SCCs are independent, run the oc commands for them concurrently
+    for out in _parallel_map(exec_policy_cmd, scc_list):
         logger.info(out)
 
 
+@lru_cache(maxsize=128)
+def _s3_base_command(access_key_id, access_key, region, endpoint, api):
+    """
+    Build the part of the AWS CLI S3 command with the MCG credentials only
+    once per MCG connection details
+
+    Args:
+        access_key_id (str): The MCG S3 access key ID
+        access_key (str): The MCG S3 secret access key
+        region (str): The MCG S3 region
+        endpoint (str): The MCG S3 internal endpoint
+        api (str): "api" for s3api, empty string for s3
+
+    Returns:
+        str: The start of the command, to be followed by the AWSCLI command
+
+    """
+    return (
+        f'sh -c "AWS_CA_BUNDLE={constants.SERVICE_CA_CRT_AWSCLI_PATH} '
+        f"AWS_ACCESS_KEY_ID={access_key_id} "
+        f"AWS_SECRET_ACCESS_KEY={access_key} "
+        f"AWS_DEFAULT_REGION={region} "
+        f"aws s3{api} "
+        f"--endpoint={endpoint} "
+    )
+
+
 def craft_s3_command(cmd, mcg_obj=None, api=False):
     """
     Crafts the AWS CLI S3 command including the
@@ -2126,19 +2555,18 @@ def craft_s3_command(cmd, mcg_obj=None, api=False):
     """
     api = "api" if api else ""
     if mcg_obj:
-        base_command = (
-            f'sh -c "AWS_CA_BUNDLE={constants.SERVICE_CA_CRT_AWSCLI_PATH} '
-            f"AWS_ACCESS_KEY_ID={mcg_obj.access_key_id} "
-            f"AWS_SECRET_ACCESS_KEY={mcg_obj.access_key} "
-            f"AWS_DEFAULT_REGION={mcg_obj.region} "
-            f"aws s3{api} "
-            f"--endpoint={mcg_obj.s3_internal_endpoint} "
+        base_command = _s3_base_command(
+            mcg_obj.access_key_id,
+            mcg_obj.access_key,
+            mcg_obj.region,
+            mcg_obj.s3_internal_endpoint,
+            api,
         )
-        string_wrapper = '"'
-    else:
-        base_command = f"aws s3{api} --no-sign-request "
-        string_wrapper = ""
-    return f"{base_command}{cmd}{string_wrapper}"
+        # The command is embedded in double quotes, escape the characters
+        # which would end them early, so it reaches sh -c unchanged
+        cmd = cmd.replace("\\", "\\\\").replace('"', '\\"')
+        return "".join((base_command, cmd, '"'))
+    return f"aws s3{api} --no-sign-request {cmd}"
 
 
 def get_current_test_name():
@@ -2182,10 +2610,14 @@ def wait_for_resource_count_change(
     min_difference=1,
     timeout=20,
     interval=2,
+    backoff_factor=1,
+    max_sleep=None,
     **func_kwargs,
 ):
     """
-    Wait for a change in total count of PVC or pod
+    Wait for a change in total count of PVC or pod. Long waits can sample
+    the count with an exponential backoff, so they don't list the resources
+    over and over
 
     Args:
         func_to_use (function): Function to be used to fetch resource info
@@ -2196,16 +2628,22 @@ def wait_for_resource_count_change(
             'increase' and 'decrease'. Default is 'increase'.
         min_difference (int): Minimum required difference in PVC/pod count
         timeout (int): Maximum wait time in seconds
-        interval (int): Time in seconds to wait between consecutive checks
+        interval (int): Initial time in seconds to wait between consecutive
+            checks
+        backoff_factor (int): Multiplier of the time between checks after
+            each check, 1 for a fixed interval
+        max_sleep (int): Upper limit of the time between checks in seconds,
+            None for no limit
 
     Returns:
         True if difference in count is greater than or equal to
             'min_difference'. False in case of timeout.
     """
+    sampler = TimeoutSampler(timeout, interval, func_to_use, namespace, **func_kwargs)
+    sampler.backoff_factor = backoff_factor
+    sampler.max_sleep = max_sleep
     try:
-        for sample in TimeoutSampler(
-            timeout, interval, func_to_use, namespace, **func_kwargs
-        ):
+        for sample in sampler:
             if func_to_use == pod.get_all_pods:
                 current_num = len(sample)
             else:
@@ -2234,13 +2672,14 @@ def verify_pv_mounted_on_node(node_pv_dict):
             eg: {'node1': ['pv1', 'pv3'], 'node2': ['pv5']}
     """
     existing_pvs = {}
-    for node_name, pvs in node_pv_dict.items():
-        cmd = f"oc debug nodes/{node_name} -- df"
-        df_on_node = run_cmd(cmd)
-        existing_pvs[node_name] = []
-        for pv_name in pvs:
-            if f"/pv/{pv_name}/" in df_on_node:
-                existing_pvs[node_name].append(pv_name)
+    # Run df on all the nodes concurrently
+    df_outputs = _parallel_map(
+        lambda node_name: run_cmd(f"oc debug nodes/{node_name} -- df"), node_pv_dict
+    )
+    for (node_name, pvs), df_on_node in zip(node_pv_dict.items(), df_outputs):
+        # Collect the names of all the PVs mounted on the node in one pass
+        mounted_pvs = set(PV_MOUNT_PATTERN.findall(df_on_node))
+        existing_pvs[node_name] = [pv_name for pv_name in pvs if pv_name in mounted_pvs]
     return existing_pvs
 
 
@@ -2254,7 +2693,7 @@ def converge_lists(list_to_converge):
     Returns:
         list (list): return converged list eg: [1,2,3,4]
     """
-    return [item for sublist in list_to_converge for item in sublist]
+    return list(chain.from_iterable(list_to_converge))
 
 
 def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_modes):
@@ -2285,17 +2724,16 @@ def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_
                     size=size,
                 )
             )
-    result_list = [result.result() for result in result_lists]
-    pvc_objs_list = converge_lists(result_list)
-    # Check for all the pvcs in Bound state
-    with ThreadPoolExecutor() as executor:
-        for objs in pvc_objs_list:
-            obj_status_list.append(
-                executor.submit(wait_for_resource_state, objs, "Bound", 90)
-            )
-    if False in [obj.result() for obj in obj_status_list]:
-        raise TimeoutExpiredError
-    return pvc_objs_list
+        # Check for all the pvcs in Bound state, start waiting for the pvcs
+        # of each access mode as soon as they are created
+        for result in as_completed(result_lists):
+            for obj in result.result():
+                obj_status_list.append(
+                    executor.submit(wait_for_resource_state, obj, "Bound", 90)
+                )
+        if False in [obj.result() for obj in obj_status_list]:
+            raise TimeoutExpiredError
+    return converge_lists([result.result() for result in result_lists])
 
 
 def create_pods_parallel(
@@ -2347,40 +2785,74 @@ def create_pods_parallel(
                     node_selector=node_selector,
                 )
             )
-    pod_objs = [pvc_obj.result() for pvc_obj in future_pod_objs]
-    # Check for all the pods are in Running state
-    # In above pod creation not waiting for the pod to be created because of threads usage
-    with ThreadPoolExecutor() as executor:
-        for obj in pod_objs:
-            future_pod_objs.append(
-                executor.submit(
-                    wait_for_resource_state, obj, "Running", timeout=wait_time
-                )
-            )
-    # If pods not up raise exception/failure
-    if False in [obj.result() for obj in future_pod_objs]:
-        raise TimeoutExpiredError
+    pod_objs = [future_pod_obj.result() for future_pod_obj in future_pod_objs]
+    # Check for all the pods are in Running state, sampling all of them with
+    # a single 'oc get pods' call instead of polling every pod on its own
+    wait_for_resources_state(pod_objs, constants.STATUS_RUNNING, timeout=wait_time)
     return pod_objs
 
 
-def delete_objs_parallel(obj_list):
+def delete_objs_parallel(obj_list, max_workers=32):
     """
     Function to delete objs specified in list
     Args:
         obj_list(list): List can be obj of pod, pvc, etc
+        max_workers (int): Maximum number of objects deleted concurrently
 
     Returns:
-        bool: True if obj deleted else False
+        bool: True if all the objs deleted else False
 
     """
-    threads = list()
-    for obj in obj_list:
-        process = threading.Thread(target=obj.delete)
-        process.start()
-        threads.append(process)
-    for process in threads:
-        process.join()
-    return True
+    obj_list = list(obj_list)
+    if not obj_list:
+        return True
+    deleted = True
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(obj_list))) as executor:
+        futures = {executor.submit(obj.delete): obj for obj in obj_list}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as ex:
+                logger.error(f"Failed to delete {futures[future].name}: {ex}")
+                deleted = False
+    return deleted
+
+
+def get_top_memory_values(worker):
+    """
+    Get all the "RES" values of ceph-osd daemon, i.e. ``list[7]`` of each
+    line, captured by the memory_leak_function fixture for a worker, in a
+    single pass over the file
+
+    Args:
+        worker (str): Name of the worker node
+
+    Returns:
+        list: The "RES" values in kb, in the order they were captured
+
+    Raises:
+        UnexpectedBehaviour: In case the file of the worker doesn't exist
+
+    """
+    filename = f"/tmp/{worker}-top-output.txt"
+    if not os.path.exists(filename):
+        logging.info(f"worker {worker} memory leak file not found")
+        raise UnexpectedBehaviour
+    values = []
+    with open(filename, "r") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 8:
+                continue
+            value = fields[7]
+            # Convert the values to kb for calculations
+            if value.endswith("g"):
+                values.append(float(1024 ** 2 * float(value[:-1])))
+            elif value.endswith("m"):
+                values.append(float(1024 * float(value[:-1])))
+            else:
+                values.append(float(value))
+    return values
 
 
 def memory_leak_analysis(median_dict):
@@ -2413,35 +2885,12 @@ def memory_leak_analysis(median_dict):
     # dict to store memory leak difference for each worker
     diff = {}
     for worker in node.get_worker_nodes():
-        memory_leak_data = []
-        if os.path.exists(f"/tmp/{worker}-top-output.txt"):
-            with open(f"/tmp/{worker}-top-output.txt", "r") as f:
-                data = f.readline()
-                list = data.split(" ")
-                list = [i for i in list if i]
-                memory_leak_data.append(list[7])
-        else:
-            logging.info(f"worker {worker} memory leak file not found")
-            raise UnexpectedBehaviour
-        number_of_lines = len(memory_leak_data) - 1
+        memory_leak_data = get_top_memory_values(worker)
         # Get the start value form median_dict arg for respective worker
         start_value = median_dict[f"{worker}"]
-        end_value = memory_leak_data[number_of_lines]
+        end_value = memory_leak_data[-1]
         logging.info(f"Median value {start_value}")
         logging.info(f"End value {end_value}")
-        # Convert the values to kb for calculations
-        if start_value.__contains__("g"):
-            start_value = float(1024 ** 2 * float(start_value[:-1]))
-        elif start_value.__contains__("m"):
-            start_value = float(1024 * float(start_value[:-1]))
-        else:
-            start_value = float(start_value)
-        if end_value.__contains__("g"):
-            end_value = float(1024 ** 2 * float(end_value[:-1]))
-        elif end_value.__contains__("m"):
-            end_value = float(1024 * float(end_value[:-1]))
-        else:
-            end_value = float(end_value)
         # Calculate the percentage of diff between start and end value
         # Based on value decide TC pass or fail
         diff[worker] = ((end_value - start_value) / start_value) * 100
@@ -2469,17 +2918,7 @@ def get_memory_leak_median_value():
     logger.info(f"waiting for {timeout} sec to evaluate the median value")
     time.sleep(timeout)
     for worker in node.get_worker_nodes():
-        memory_leak_data = []
-        if os.path.exists(f"/tmp/{worker}-top-output.txt"):
-            with open(f"/tmp/{worker}-top-output.txt", "r") as f:
-                data = f.readline()
-                list = data.split(" ")
-                list = [i for i in list if i]
-                memory_leak_data.append(list[7])
-        else:
-            logging.info(f"worker {worker} memory leak file not found")
-            raise UnexpectedBehaviour
-        median_dict[f"{worker}"] = statistics.median(memory_leak_data)
+        median_dict[f"{worker}"] = statistics.median(get_top_memory_values(worker))
     return median_dict
 
 
@@ -2512,23 +2951,19 @@ def rsync_kubeconf_to_node(node):
         node (str): OCP node to copy kubeconfig if not present
 
     """
-    # ocp_obj = ocp.OCP()
     filename = os.path.join(
         config.ENV_DATA["cluster_path"], config.RUN["kubeconfig_location"]
     )
     file_path = os.path.dirname(filename)
-    master_list = node.get_master_nodes()
     ocp_obj = ocp.OCP()
-    check_auth = "auth"
-    check_conf = "kubeconfig"
     node_path = "/home/core/"
-    if check_auth not in ocp_obj.exec_oc_debug_cmd(
-        node=master_list[0], cmd_list=[f"ls {node_path}"]
-    ):
-        ocp.rsync(src=file_path, dst=f"{node_path}", node=node, dst_node=True)
-    elif check_conf not in ocp_obj.exec_oc_debug_cmd(
-        node=master_list[0], cmd_list=[f"ls {node_path}auth"]
-    ):
+    # Check the presence of the kubeconfig within a single debug session,
+    # every 'oc debug' has to start a debug pod on the node
+    out = ocp_obj.exec_oc_debug_cmd(
+        node=node,
+        cmd_list=[f"test -e {node_path}auth/kubeconfig && echo PRESENT || echo ABSENT"],
+    )
+    if "PRESENT" not in out:
         ocp.rsync(src=file_path, dst=f"{node_path}", node=node, dst_node=True)
 
 
@@ -2569,8 +3004,8 @@ def create_dummy_osd(deployment):
     oc.create(osd_file.name)
 
     # downscale the original deployment and start dummy deployment instead
-    oc.exec_oc_cmd(f"scale --replicas=0 deployment/{deployment}")
-    oc.exec_oc_cmd(f"scale --replicas=1 deployment/{dummy_deployment}")
+    modify_deployment_replica_count(deployment, 0)
+    modify_deployment_replica_count(dummy_deployment, 1)
 
     osd_list = pod.get_osd_pods()
     dummy_pod = [pod for pod in osd_list if dummy_deployment in pod.name][0]
@@ -2593,22 +3028,29 @@ def create_dummy_osd(deployment):
     return dummy_deployment, dummy_pod
 
 
+@ttl_cache(ttl=300, scope=_current_cluster)
 def get_failure_domin():
     """
-    Function is used to getting failure domain of pool
+    Function is used to getting failure domain of pool. The crush rules
+    rarely change, so the result is cached, call
+    get_failure_domin.cache_clear() after changing the crush rules
 
     Returns:
         str: Failure domain from cephblockpool
 
     """
-    ct_pod = pod.get_ceph_tools_pod()
-    out = ct_pod.exec_ceph_cmd(ceph_cmd="ceph osd crush rule dump", format="json")
+    out = exec_ceph_cmd_on_tools_pod("ceph osd crush rule dump", format="json")
     assert out, "Failed to get cmd output"
-    for crush_rule in out:
-        if constants.CEPHBLOCKPOOL.lower() in crush_rule.get("rule_name"):
-            for steps in crush_rule.get("steps"):
-                if "type" in steps:
-                    return steps.get("type")
+    return next(
+        (
+            step["type"]
+            for crush_rule in out
+            if constants.CEPHBLOCKPOOL.lower() in crush_rule.get("rule_name")
+            for step in crush_rule.get("steps")
+            if "type" in step
+        ),
+        None,
+    )
 
 
 def wait_for_ct_pod_recovery():
@@ -2620,6 +3062,8 @@ def wait_for_ct_pod_recovery():
         bool: True in case the ceph tools pod was recovered, False otherwise
 
     """
+    # get_admin_key() is used as a probe, so make sure it reaches the cluster
+    clear_ceph_tools_pod_cache()
     try:
         _ = get_admin_key()
     except CommandFailed as ex:
@@ -2634,8 +3078,11 @@ def wait_for_ct_pod_recovery():
                 previous_num=1,
                 namespace=config.ENV_DATA["cluster_namespace"],
                 timeout=120,
+                backoff_factor=2,
+                max_sleep=8,
                 selector=constants.TOOL_APP_LABEL,
             )
+            clear_ceph_tools_pod_cache()
             return True
         else:
             return False
@@ -2685,18 +3132,21 @@ def get_pods_nodes_logs():
     all_pods = pod.get_all_pods()
     all_nodes = node.get_node_objs()
 
-    for node_obj in all_nodes:
-        node_name = node_obj.name
-        log_content = node.get_node_logs(node_name)
-        all_logs.update({node_name: log_content})
-
-    for pod_obj in all_pods:
+    def get_pod_logs(pod_name):
         try:
-            pod_name = pod_obj.name
-            log_content = pod.get_pod_logs(pod_name)
-            all_logs.update({pod_name: log_content})
+            return pod.get_pod_logs(pod_name)
         except CommandFailed:
-            pass
+            return None
+
+    fetches = [(node_obj.name, node.get_node_logs) for node_obj in all_nodes]
+    fetches += [(pod_obj.name, get_pod_logs) for pod_obj in all_pods]
+
+    # Fetch all the logs in one concurrent batch, every fetch is a separate
+    # oc call and the slow 'oc debug' of the nodes overlaps the pod fetches
+    all_logs_content = _parallel_map(lambda fetch: fetch[1](fetch[0]), fetches)
+    for (name, _), log_content in zip(fetches, all_logs_content):
+        if log_content is not None:
+            all_logs[name] = log_content
 
     return all_logs
 
@@ -2720,15 +3170,17 @@ def get_logs_with_errors(errors=None):
     if errors:
         errors_list = errors_list + errors
 
+    # Look for all the errors in a single pass over each log
+    errors_pattern = re.compile("|".join(re.escape(error) for error in errors_list))
     for name, log_content in all_logs.items():
-        for error_msg in errors_list:
-            if error_msg in log_content:
-                logger.debug(f"Found '{error_msg}' in log of {name}")
-                output_logs.update({name: log_content})
+        match = errors_pattern.search(log_content)
+        if match:
+            logger.debug(f"Found '{match.group()}' in log of {name}")
+            output_logs.update({name: log_content})
 
-                log_path = f"{ocsci_log_path()}/{name}.log"
-                with open(log_path, "w") as fh:
-                    fh.write(log_content)
+            log_path = f"{ocsci_log_path()}/{name}.log"
+            with open(log_path, "w") as fh:
+                fh.write(log_content)
 
     return output_logs
 
@@ -2742,15 +3194,14 @@ def modify_osd_replica_count(resource_name, replica_count):
         replica_count (int): osd replica count to be changed to
 
     Returns:
-        bool: True in case if changes are applied. False otherwise
+        bool: True in case if changes are applied
+
+    Raises:
+        CommandFailed: In case the deployment can't be scaled
 
     """
-    ocp_obj = ocp.OCP(
-        kind=constants.DEPLOYMENT, namespace=defaults.ROOK_CLUSTER_NAMESPACE
-    )
-    params = f'{{"spec": {{"replicas": {replica_count}}}}}'
     resource_name = "-".join(resource_name.split("-")[0:4])
-    return ocp_obj.patch(resource_name=resource_name, params=params)
+    return modify_deployments_replica_count([resource_name], replica_count)
 
 
 def modify_deployment_replica_count(deployment_name, replica_count):
@@ -2763,14 +3214,40 @@ def modify_deployment_replica_count(deployment_name, replica_count):
         replica_count (int): replica count to be changed to
 
     Returns:
-        bool: True in case if changes are applied. False otherwise
+        bool: True in case if changes are applied
+
+    Raises:
+        CommandFailed: In case the deployment can't be scaled
+
+    """
+    return modify_deployments_replica_count([deployment_name], replica_count)
+
+
+def modify_deployments_replica_count(deployment_names, replica_count):
+    """
+    Function to modify replica count of multiple deployments at once, using
+    a single 'oc scale' call instead of one patch per deployment
+
+    Args:
+        deployment_names (list): Names of the deployments
+        replica_count (int): replica count to be changed to
+
+    Returns:
+        bool: True in case if changes are applied to all the deployments
+
+    Raises:
+        CommandFailed: In case any of the deployments can't be scaled
 
     """
     ocp_obj = ocp.OCP(
         kind=constants.DEPLOYMENT, namespace=defaults.ROOK_CLUSTER_NAMESPACE
     )
-    params = f'{{"spec": {{"replicas": {replica_count}}}}}'
-    return ocp_obj.patch(resource_name=deployment_name, params=params)
+    deployments = " ".join(f"deployment/{name}" for name in deployment_names)
+    # oc scale exits with non zero code if any of the deployments isn't scaled
+    ocp_obj.exec_oc_cmd(
+        f"scale --replicas={replica_count} {deployments}", out_yaml_format=False
+    )
+    return True
 
 
 def collect_performance_stats(dir_name):
@@ -2791,11 +3268,12 @@ def collect_performance_stats(dir_name):
         f"failed_testcase_ocs_logs_{config.RUN['run_id']}",
         f"{dir_name}_performance_stats",
     )
-    if not os.path.exists(log_dir_path):
-        logger.info(f"Creating directory {log_dir_path}")
-        os.makedirs(log_dir_path)
+    logger.info(f"Storing the performance stats in {log_dir_path}")
+    os.makedirs(log_dir_path, exist_ok=True)
 
-    performance_stats = {}
+    # Every stat is collected by separate ceph or oc commands, collect them
+    # concurrently so the total time is given by the slowest one
+    stats_collectors = {}
     external = config.DEPLOYMENT["external_mode"]
     if external:
         # Skip collecting performance_stats for external mode RHCS cluster
@@ -2804,42 +3282,39 @@ def collect_performance_stats(dir_name):
         ceph_obj = CephCluster()
 
         # Get iops and throughput percentage of cluster
-        iops_percentage = ceph_obj.get_iops_percentage()
-        throughput_percentage = ceph_obj.get_throughput_percentage()
-
-        performance_stats["iops_percentage"] = iops_percentage
-        performance_stats["throughput_percentage"] = throughput_percentage
+        stats_collectors["iops_percentage"] = ceph_obj.get_iops_percentage
+        stats_collectors["throughput_percentage"] = ceph_obj.get_throughput_percentage
 
     # ToDo: Get iops and throughput percentage of each nodes
 
     # Get the cpu and memory of each nodes from adm top
-    master_node_utilization_from_adm_top = (
-        node.get_node_resource_utilization_from_adm_top(node_type="master")
+    stats_collectors["master_node_utilization"] = partial(
+        node.get_node_resource_utilization_from_adm_top, node_type="master"
     )
-    worker_node_utilization_from_adm_top = (
-        node.get_node_resource_utilization_from_adm_top(node_type="worker")
+    stats_collectors["worker_node_utilization"] = partial(
+        node.get_node_resource_utilization_from_adm_top, node_type="worker"
     )
 
     # Get the cpu and memory from describe of nodes
-    master_node_utilization_from_oc_describe = (
-        node.get_node_resource_utilization_from_oc_describe(node_type="master")
+    stats_collectors["master_node_utilization_from_oc_describe"] = partial(
+        node.get_node_resource_utilization_from_oc_describe, node_type="master"
     )
-    worker_node_utilization_from_oc_describe = (
-        node.get_node_resource_utilization_from_oc_describe(node_type="worker")
+    stats_collectors["worker_node_utilization_from_oc_describe"] = partial(
+        node.get_node_resource_utilization_from_oc_describe, node_type="worker"
     )
 
-    performance_stats["master_node_utilization"] = master_node_utilization_from_adm_top
-    performance_stats["worker_node_utilization"] = worker_node_utilization_from_adm_top
-    performance_stats[
-        "master_node_utilization_from_oc_describe"
-    ] = master_node_utilization_from_oc_describe
-    performance_stats[
-        "worker_node_utilization_from_oc_describe"
-    ] = worker_node_utilization_from_oc_describe
+    performance_stats = dict(
+        zip(
+            stats_collectors,
+            _parallel_map(lambda collector: collector(), stats_collectors.values()),
+        )
+    )
 
     file_name = os.path.join(log_dir_path, "performance")
+    # json.dumps() serializes with the C encoder and the file gets a single
+    # write, json.dump() would encode and write it token by token in Python
     with open(file_name, "w") as outfile:
-        json.dump(performance_stats, outfile)
+        outfile.write(json.dumps(performance_stats))
 
 
 def validate_pod_oomkilled(
@@ -2863,11 +3338,16 @@ def validate_pod_oomkilled(
     """
     rc = True
     try:
+        # The kill message is logged when the container gets killed, so it
+        # is at the end of the previous container log
         pod_log = pod.get_pod_logs(
-            pod_name=pod_name, namespace=namespace, container=container, previous=True
+            pod_name=pod_name,
+            namespace=namespace,
+            container=container,
+            previous=True,
+            tail=500,
         )
-        result = pod_log.find("signal: killed")
-        if result != -1:
+        if "signal: killed" in pod_log:
             rc = False
     except CommandFailed as ecf:
         assert (
@@ -2884,7 +3364,9 @@ def validate_pods_are_running_and_not_restarted(pod_name, pod_restart_count, nam
 
     Args:
         pod_name (str): Name of the pod
-        pod_restart_count (int): Restart count of pod
+        pod_restart_count (int or dict): Restart count of the first container
+            of the pod, or container names and their restart counts to
+            validate several containers with a single fetch of the pod
         namespace (str): Namespace of the pod
 
     Returns:
@@ -2894,15 +3376,25 @@ def validate_pods_are_running_and_not_restarted(pod_name, pod_restart_count, nam
     """
     ocp_obj = ocp.OCP(kind=constants.POD, namespace=namespace)
     pod_obj = ocp_obj.get(resource_name=pod_name)
-    restart_count = (
-        pod_obj.get("status").get("containerStatuses")[0].get("restartCount")
-    )
+    container_statuses = pod_obj.get("status").get("containerStatuses")
+    restart_counts = {
+        status.get("name"): status.get("restartCount") for status in container_statuses
+    }
+    if not isinstance(pod_restart_count, dict):
+        # A single restart count is the one of the first container
+        pod_restart_count = {container_statuses[0].get("name"): pod_restart_count}
+    restarted_containers = [
+        container
+        for container, restart_count in pod_restart_count.items()
+        if restart_counts.get(container) != restart_count
+    ]
     pod_state = pod_obj.get("status").get("phase")
-    if pod_state == "Running" and restart_count == pod_restart_count:
+    if pod_state == "Running" and not restarted_containers:
         logger.info("Pod is running state and restart count matches with previous one")
         return True
     logger.error(
-        f"Pod is in {pod_state} state and restart count of pod {restart_count}"
+        f"Pod is in {pod_state} state and restart count of containers "
+        f"{restarted_containers} changed, current restart counts {restart_counts}"
     )
     logger.info(f"{pod_obj}")
     return False
@@ -2919,9 +3411,12 @@ def calc_local_file_md5_sum(path):
         str: The MD5 checksum
 
     """
+    md5_sum = hashlib.md5()
+    # Hash the file in chunks, the files can be too big to be read at once
     with open(path, "rb") as file_to_hash:
-        file_as_bytes = file_to_hash.read()
-    return hashlib.md5(file_as_bytes).hexdigest()
+        for chunk in iter(lambda: file_to_hash.read(1024 * 1024), b""):
+            md5_sum.update(chunk)
+    return md5_sum.hexdigest()
 
 
 def retrieve_default_ingress_crt():
@@ -2941,16 +3436,18 @@ def retrieve_default_ingress_crt():
         .get("tls.crt")
     )
 
-    decoded_crt = base64.b64decode(default_ingress_crt_b64).decode("utf-8")
+    decoded_crt = base64.b64decode(default_ingress_crt_b64)
 
-    with open(constants.DEFAULT_INGRESS_CRT_LOCAL_PATH, "w") as crtfile:
+    with open(constants.DEFAULT_INGRESS_CRT_LOCAL_PATH, "wb") as crtfile:
         crtfile.write(decoded_crt)
 
 
+@ttl_cache(ttl=30, scope=_current_cluster)
 def storagecluster_independent_check():
     """
     Check whether the storagecluster is running in independent mode
-    by checking the value of spec.externalStorage.enable
+    by checking the value of spec.externalStorage.enable. The result is
+    cached for a short time, the mode of the cluster doesn't change
 
     Returns:
         bool: True if storagecluster is running on external mode False otherwise
@@ -2978,13 +3475,21 @@ def get_pv_size(storageclass=None):
         list: list of pv's size
 
     """
-    return_list = []
-
+    # Only the needed fields are fetched, parsing full PVs is slow on big
+    # clusters. The API server doesn't support a field selector on the
+    # storageclass of PVs, so the filtering is done here
     ocp_obj = ocp.OCP(kind=constants.PV)
-    pv_objs = ocp_obj.get()["items"]
-    for pv_obj in pv_objs:
-        if pv_obj["spec"]["storageClassName"] == storageclass:
-            return_list.append(pv_obj["spec"]["capacity"]["storage"])
+    out = ocp_obj.exec_oc_cmd(
+        "get pv -o jsonpath='{range .items[*]}"
+        '{.spec.storageClassName}{" "}{.spec.capacity.storage}{"\\n"}'
+        "{end}'",
+        out_yaml_format=False,
+    )
+    return_list = []
+    for line in out.splitlines():
+        pv_storageclass, _, pv_size = line.rpartition(" ")
+        if pv_storageclass == storageclass:
+            return_list.append(pv_size)
     return return_list
 
 
@@ -2997,8 +3502,10 @@ def get_pv_names():
 
     """
     ocp_obj = ocp.OCP(kind=constants.PV)
-    pv_objs = ocp_obj.get()["items"]
-    return [pv_obj["metadata"]["name"] for pv_obj in pv_objs]
+    out = ocp_obj.exec_oc_cmd(
+        "get pv -o jsonpath='{.items[*].metadata.name}'", out_yaml_format=False
+    )
+    return out.split()
 
 
 def default_volumesnapshotclass(interface_type):
@@ -3062,7 +3569,8 @@ def wait_for_pv_delete(pv_objs):
         pv_objs (list): OCS instances of kind PersistentVolume
 
     """
-    for pv_obj in pv_objs:
+
+    def wait_for_one_pv_delete(pv_obj):
         if (
             pv_obj.data.get("spec").get("persistentVolumeReclaimPolicy")
             == constants.RECLAIM_POLICY_RETAIN
@@ -3071,6 +3579,10 @@ def wait_for_pv_delete(pv_objs):
             pv_obj.delete()
         pv_obj.ocp.wait_for_delete(resource_name=pv_obj.name, timeout=180)
 
+    # Wait for the PVs concurrently, so the total wait is given by the
+    # slowest PV instead of the sum of all of them
+    _parallel_map(wait_for_one_pv_delete, pv_objs)
+
 
 @retry(UnexpectedBehaviour, tries=20, delay=10, backoff=1)
 def fetch_used_size(cbp_name, exp_val=None):
@@ -3082,12 +3594,11 @@ def fetch_used_size(cbp_name, exp_val=None):
         float: Used size in GB
     """
 
-    ct_pod = pod.get_ceph_tools_pod()
-    rados_status = ct_pod.exec_ceph_cmd(ceph_cmd=f"rados df -p {cbp_name}")
+    rados_status = exec_ceph_cmd_on_tools_pod(f"rados df -p {cbp_name}")
     size_bytes = rados_status["pools"][0]["size_bytes"]
 
     # Convert size to GB
-    used_in_gb = float(format(size_bytes / constants.GB, ".4f"))
+    used_in_gb = round(size_bytes / constants.GB, 4)
     if exp_val and abs(exp_val - used_in_gb) > 1.5:
         raise UnexpectedBehaviour(
             f"Actual {used_in_gb} and expected size {exp_val} not "
@@ -3114,14 +3625,18 @@ def get_full_test_logs_path(cname, fname=None):
 
     """
 
+    # Only the frame of the caller is needed, inspect.stack() would build the
+    # whole stack with the source code context of every frame
+    caller_code = inspect.currentframe().f_back.f_code
+
     # the module path relative to ocs-ci base path
-    log_file_name = (inspect.stack()[1][1]).replace(f"{os.getcwd()}/", "")
+    log_file_name = caller_code.co_filename.replace(f"{os.getcwd()}/", "")
 
     # The name of the class
     mname = type(cname).__name__
 
     if fname is None:
-        fname = inspect.stack()[1][3]
+        fname = caller_code.co_name
 
     # the full log path (relative to ocs-ci base path)
     full_log_path = f"{ocsci_log_path()}/{log_file_name}/{mname}/{fname}"
@@ -3146,9 +3661,10 @@ def get_mon_pdb():
         namespace=defaults.ROOK_CLUSTER_NAMESPACE,
     )
 
-    disruptions_allowed = pdb_obj.get().get("status").get("disruptionsAllowed")
-    min_available_mon = pdb_obj.get().get("spec").get("minAvailable")
-    max_unavailable_mon = pdb_obj.get().get("spec").get("maxUnavailable")
+    pdb_data = pdb_obj.get()
+    disruptions_allowed = pdb_data.get("status").get("disruptionsAllowed")
+    min_available_mon = pdb_data.get("spec").get("minAvailable")
+    max_unavailable_mon = pdb_data.get("spec").get("maxUnavailable")
     return disruptions_allowed, min_available_mon, max_unavailable_mon
 
 
@@ -3198,19 +3714,23 @@ def run_cmd_verify_cli_output(
 
     """
     if cephtool_cmd is True:
-        tool_pod = pod.get_ceph_tools_pod()
+        tool_pod = get_cached_ceph_tools_pod()
         cmd_start = f"oc rsh -n openshift-storage {tool_pod.name} "
         cmd = f"{cmd_start} {cmd}"
     elif debug_node is not None:
         cmd_start = f"oc debug nodes/{debug_node} -- chroot /host /bin/bash -c "
         cmd = f'{cmd_start} "{cmd}"'
 
-    out = run_cmd(cmd=cmd)
+    try:
+        out = run_cmd(cmd=cmd)
+    except CommandFailed:
+        # The Ceph tools pod might have been replaced, look it up again on
+        # the next try
+        if cephtool_cmd is True:
+            clear_ceph_tools_pod_cache()
+        raise
     logger.info(out)
-    for expected_output in expected_output_lst:
-        if expected_output not in out:
-            return False
-    return True
+    return all(expected_output in out for expected_output in expected_output_lst)
 
 
 def check_rbd_image_used_size(
@@ -3230,13 +3750,11 @@ def check_rbd_image_used_size(
         bool: True if the verification is success for all the PVCs, False otherwise
 
     """
-    ct_pod = pod.get_ceph_tools_pod()
     no_match_list = []
     for pvc_obj in pvc_objs:
         rbd_image_name = pvc_obj.get_rbd_image_name
-        du_out = ct_pod.exec_ceph_cmd(
-            ceph_cmd=f"rbd du -p {rbd_pool} {rbd_image_name}",
-            format="",
+        du_out = exec_ceph_cmd_on_tools_pod(
+            f"rbd du -p {rbd_pool} {rbd_image_name}", format=""
         )
         used_size = "".join(du_out.strip().split()[-2:])
         if expect_match:
@@ -3264,36 +3782,59 @@ def check_rbd_image_used_size(
     return True
 
 
-def set_configmap_log_level_rook_ceph_operator(value):
+def set_configmap_rook_ceph_operator(data):
     """
-    Set ROOK_LOG_LEVEL on configmap of rook-ceph-operator
+    Set multiple keys on configmap of rook-ceph-operator with a single patch
 
     Args:
-        value (str): type of log
+        data (dict): The configmap keys and their values to set,
+            e.g. {"ROOK_LOG_LEVEL": "DEBUG"}
 
     """
-    path = "/data/ROOK_LOG_LEVEL"
-    params = f"""[{{"op": "add", "path": "{path}", "value": "{value}"}}]"""
+    params = json.dumps(
+        [
+            {"op": "add", "path": f"/data/{key}", "value": value}
+            for key, value in data.items()
+        ]
+    )
     configmap_obj = OCP(
         kind=constants.CONFIGMAP,
         namespace=constants.OPENSHIFT_STORAGE_NAMESPACE,
         resource_name=constants.ROOK_OPERATOR_CONFIGMAP,
     )
-    logger.info(f"Setting ROOK_LOG_LEVEL to: {value}")
+    logger.info(f"Setting {data} on configmap {constants.ROOK_OPERATOR_CONFIGMAP}")
     configmap_obj.patch(params=params, format_type="json")
 
 
-def get_logs_rook_ceph_operator():
+def set_configmap_log_level_rook_ceph_operator(value):
+    """
+    Set ROOK_LOG_LEVEL on configmap of rook-ceph-operator
+
+    Args:
+        value (str): type of log
+
+    """
+    logger.info(f"Setting ROOK_LOG_LEVEL to: {value}")
+    set_configmap_rook_ceph_operator({"ROOK_LOG_LEVEL": value})
+
+
+def get_logs_rook_ceph_operator(tail=None, since_time=None):
     """
     Get logs from a rook_ceph_operator pod
 
+    Args:
+        tail (int): Get only this number of the most recent log lines
+        since_time (str): Get only the logs newer than this RFC3339 timestamp
+
     Returns:
         str: Output from 'oc get logs rook-ceph-operator command
 
     """
     logger.info("Get logs from rook_ceph_operator pod")
     rook_ceph_operator_objs = pod.get_operator_pods()
-    return pod.get_pod_logs(pod_name=rook_ceph_operator_objs[0].name)
+    return pod.get_pod_logs(
+        pod_name=rook_ceph_operator_objs[0].name, tail=tail, since_time=since_time
+    )
 
 
 def check_osd_log_exist_on_rook_ceph_operator_pod(
@@ -3317,30 +3858,36 @@ def check_osd_log_exist_on_rook_ceph_operator_pod(
     osd_pod_objs = pod.get_osd_pods()
     osd_pod_obj = random.choice(osd_pod_objs)
     osd_pod_obj.delete()
-    new_logs = list()
-    rook_ceph_operator_logs = get_logs_rook_ceph_operator()
-    for line in rook_ceph_operator_logs.splitlines():
-        log_date_time_obj = get_event_line_datetime(line)
-        if log_date_time_obj and log_date_time_obj > last_log_date_time_obj:
-            new_logs.append(line)
+    # Fetch only the logs of the second of the last log time and newer, the
+    # operator logs in UTC. The lines of that second which are not newer are
+    # filtered out here
+    rook_ceph_operator_logs = get_logs_rook_ceph_operator(
+        since_time=last_log_date_time_obj.strftime("%Y-%m-%dT%H:%M:%SZ")
+    )
     res_expected = False
     res_unexpected = True
-    for new_log in new_logs:
-        if all(
-            expected_string.lower() in new_log.lower()
-            for expected_string in expected_strings
+    expected_strings_lower = [string.lower() for string in expected_strings]
+    unexpected_strings_lower = [string.lower() for string in unexpected_strings]
+    for line in rook_ceph_operator_logs.splitlines():
+        log_date_time_obj = get_event_line_datetime(line)
+        if not log_date_time_obj or log_date_time_obj <= last_log_date_time_obj:
+            continue
+        line_lower = line.lower()
+        if not res_expected and all(
+            expected_string in line_lower for expected_string in expected_strings_lower
         ):
             res_expected = True
-            logger.info(f"{new_log} contain expected strings {expected_strings}")
-            break
-    for new_log in new_logs:
+            logger.info(f"{line} contain expected strings {expected_strings}")
         if any(
-            unexpected_string.lower() in new_log.lower()
-            for unexpected_string in unexpected_strings
+            unexpected_string in line_lower
+            for unexpected_string in unexpected_strings_lower
         ):
-            logger.error(f"{new_log} contain unexpected strings {unexpected_strings}")
+            logger.error(f"{line} contain unexpected strings {unexpected_strings}")
             res_unexpected = False
             break
+        # Without unexpected strings, nothing more can change the result
+        if res_expected and not unexpected_strings_lower:
+            break
     return res_expected & res_unexpected
 
 
@@ -3353,12 +3900,15 @@ def get_last_log_time_date():
 
     """
     logger.info("Get last log time")
-    rook_ceph_operator_logs = get_logs_rook_ceph_operator()
-    for line in rook_ceph_operator_logs.splitlines():
-        log_date_time_obj = get_event_line_datetime(line)
-        if log_date_time_obj:
-            last_log_date_time_obj = log_date_time_obj
-    return last_log_date_time_obj
+    # The last datetime is almost always within the most recent lines, the
+    # whole logs are fetched only if those have no datetime
+    for tail in (100, None):
+        rook_ceph_operator_logs = get_logs_rook_ceph_operator(tail=tail)
+        # Search from the end of the logs, the first datetime found is the last
+        for line in reversed(rook_ceph_operator_logs.splitlines()):
+            last_log_date_time_obj = get_event_line_datetime(line)
+            if last_log_date_time_obj:
+                return last_log_date_time_obj
 
 
 def clear_crash_warning_and_osd_removal_leftovers():
@@ -3378,22 +3928,20 @@ def clear_crash_warning_and_osd_removal_leftovers():
         logger.warning("There are still osds down. Can't clear ceph crash warnings")
         return
 
-    is_daemon_recently_crash_warnings = run_cmd_verify_cli_output(
-        cmd="ceph health detail",
-        expected_output_lst={"HEALTH_WARN", "daemons have recently crashed"},
-        cephtool_cmd=True,
-    )
-    if is_daemon_recently_crash_warnings:
+    # The crash warnings are raised for the crashes which are not archived yet
+    new_crashes = exec_ceph_cmd_on_tools_pod("ceph crash ls-new", format="json")
+    if new_crashes:
         logger.info("Clear all ceph crash warnings")
-        ct_pod = pod.get_ceph_tools_pod()
-        ct_pod.exec_ceph_cmd(ceph_cmd="ceph crash archive-all")
+        exec_ceph_cmd_on_tools_pod("ceph crash archive-all")
     else:
         logger.info("There are no daemon crash warnings")
 
 
+@ttl_cache(ttl=30, scope=_current_cluster)
 def get_noobaa_url():
     """
-    Get the URL of noobaa console
+    Get the URL of noobaa console. The result is cached for a short time,
+    the route is rarely changed
 
     Returns:
         str: url of noobaa console
@@ -3483,11 +4031,13 @@ def get_event_line_datetime(event_line):
 
     """
     event_line_dt = None
-    regex = r"\d{4}-\d{2}-\d{2}"
-    if re.search(regex + "T", event_line):
+    # The datetime is parsed from the start of the line, so only a date at
+    # the start of the line is looked for
+    date_match = EVENT_LINE_DATE_PATTERN.match(event_line)
+    if date_match and date_match.group(1):
         dt_string = event_line[:23].replace("T", " ")
         event_line_dt = datetime.datetime.strptime(dt_string, "%Y-%m-%d %H:%M:%S.%f")
-    elif re.search(regex, event_line):
+    elif date_match:
         dt_string = event_line[:26]
         event_line_dt = datetime.datetime.strptime(dt_string, "%Y-%m-%d %H:%M:%S.%f")
 
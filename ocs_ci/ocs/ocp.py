@@ -4,7 +4,9 @@ General OCP object
 import logging
 import os
 import re
+import selectors
 import shlex
+import subprocess
 import tempfile
 import time
 import yaml
@@ -99,6 +101,108 @@ class OCP(object):
         """
         self._data = self.get()
 
+    def build_oc_cmd(self, command):
+        """
+        Build the full 'oc' command line, including the kubeconfig and the
+        namespace options
+
+        Args:
+            command (str): The command to execute (e.g. create -f file.yaml)
+                without the initial 'oc' at the beginning
+
+        Returns:
+            str: The full 'oc' command
+
+        """
+        oc_cmd = "oc "
+        env_kubeconfig = os.getenv("KUBECONFIG")
+        if not env_kubeconfig or not os.path.exists(env_kubeconfig):
+            cluster_dir_kubeconfig = os.path.join(
+                config.ENV_DATA["cluster_path"], config.RUN.get("kubeconfig_location")
+            )
+            if os.path.exists(cluster_dir_kubeconfig):
+                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
+
+        if self.namespace:
+            oc_cmd += f"-n {self.namespace} "
+
+        return oc_cmd + command
+
+    def follow_oc_cmds(self, commands, timeout):
+        """
+        Execute several long running 'oc' commands (e.g. logs -f) at once
+        and yield the lines of their outputs as they arrive, multiplexing
+        all the outputs in a single thread. The commands are terminated once
+        the timeout expires or the consumer stops iterating
+
+        Args:
+            commands (list): The commands to execute without the initial
+                'oc' at the beginning
+            timeout (int): Time in seconds after which to stop following
+                the outputs
+
+        Yields:
+            str: Lines of the commands outputs, without the trailing newline
+
+        Raises:
+            CommandFailed: In case one of the commands exits with non zero code
+
+        """
+        deadline = time.monotonic() + timeout
+        selector = selectors.DefaultSelector()
+        procs = []
+        try:
+            for command in commands:
+                oc_cmd = self.build_oc_cmd(command)
+                log.info(f"Executing command: {oc_cmd}")
+                proc = subprocess.Popen(
+                    shlex.split(oc_cmd),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+                procs.append(proc)
+                # stderr is read along with stdout, so a full stderr pipe
+                # can't block the command
+                state = {"cmd": oc_cmd, "pending": b"", "stderr": b"", "open": 2}
+                selector.register(proc.stdout, selectors.EVENT_READ, (proc, state))
+                selector.register(proc.stderr, selectors.EVENT_READ, (proc, state))
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    log.info(f"Stopped following the commands after {timeout}s")
+                    return
+                for key, _ in selector.select(remaining):
+                    proc, state = key.data
+                    # read the raw fd, buffered reads could hide data from select
+                    chunk = os.read(key.fd, 65536)
+                    if key.fileobj is proc.stderr:
+                        state["stderr"] += chunk
+                    elif chunk:
+                        *lines, state["pending"] = (state["pending"] + chunk).split(
+                            b"\n"
+                        )
+                        for line in lines:
+                            yield line.decode(errors="replace")
+                    elif state["pending"]:
+                        yield state["pending"].decode(errors="replace")
+                    if chunk:
+                        continue
+                    selector.unregister(key.fileobj)
+                    state["open"] -= 1
+                    if not state["open"] and proc.wait():
+                        raise CommandFailed(
+                            f"Error during execution of command: {state['cmd']}."
+                            f"\nError is {state['stderr'].decode(errors='replace')}"
+                        )
+        finally:
+            selector.close()
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.terminate()
+                proc.wait()
+                proc.stdout.close()
+                proc.stderr.close()
+
     def exec_oc_cmd(
         self,
         command,
@@ -128,19 +232,7 @@ class OCP(object):
             str: If out_yaml_format is False.
 
         """
-        oc_cmd = "oc "
-        env_kubeconfig = os.getenv("KUBECONFIG")
-        if not env_kubeconfig or not os.path.exists(env_kubeconfig):
-            cluster_dir_kubeconfig = os.path.join(
-                config.ENV_DATA["cluster_path"], config.RUN.get("kubeconfig_location")
-            )
-            if os.path.exists(cluster_dir_kubeconfig):
-                oc_cmd += f"--kubeconfig {cluster_dir_kubeconfig} "
-
-        if self.namespace:
-            oc_cmd += f"-n {self.namespace} "
-
-        oc_cmd += command
+        oc_cmd = self.build_oc_cmd(command)
         out = run_cmd(
             cmd=oc_cmd,
             secrets=secrets,
@@ -501,6 +593,8 @@ class OCP(object):
         sleep=3,
         dont_allow_other_resources=False,
         error_condition=None,
+        backoff_factor=1,
+        max_sleep=None,
     ):
         """
         Wait for a resource to reach to a desired condition
@@ -529,6 +623,10 @@ class OCP(object):
                 unrecoverable state of the resource(s) which is not expected to
                 be part of a workflow under test, and at the same time, the
                 timeout itself is large.
+            backoff_factor (int): Multiplier of the sampling time after each
+                sample, 1 for a fixed sampling time
+            max_sleep (int): Upper limit of the sampling time in seconds when
+                backoff_factor is used
 
         Returns:
             bool: True in case all resources reached desired condition,
@@ -558,10 +656,13 @@ class OCP(object):
         # now prevents UnboundLocalError raised when waiting timeouts
         actual_status = None
 
+        sampler = TimeoutSampler(
+            timeout, sleep, self.get, resource_name, True, selector
+        )
+        sampler.backoff_factor = backoff_factor
+        sampler.max_sleep = max_sleep
         try:
-            for sample in TimeoutSampler(
-                timeout, sleep, self.get, resource_name, True, selector
-            ):
+            for sample in sampler:
 
                 # Only 1 resource expected to be returned
                 if resource_name:
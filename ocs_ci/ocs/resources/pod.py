@@ -1142,6 +1142,8 @@ def get_pod_logs(
     namespace=defaults.ROOK_CLUSTER_NAMESPACE,
     previous=False,
     all_containers=False,
+    since_time=None,
+    tail=None,
 ):
     """
     Get logs from a given pod
@@ -1151,6 +1153,8 @@ def get_pod_logs(
     namespace (str): Namespace of the pod
     previous (bool): True, if pod previous log required. False otherwise.
     all_containers (bool): fetch logs from all containers of the resource
+    since_time (str): fetch only the logs newer than this RFC3339 timestamp
+    tail (int): fetch only this number of the most recent log lines
 
     Returns:
         str: Output from 'oc get logs <pod_name> command
@@ -1163,6 +1167,10 @@ def get_pod_logs(
         cmd += " --previous"
     if all_containers:
         cmd += " --all-containers=true"
+    if since_time:
+        cmd += f" --since-time={since_time}"
+    if tail:
+        cmd += f" --tail={tail}"
 
     return pod.exec_oc_cmd(cmd, out_yaml_format=False)
 
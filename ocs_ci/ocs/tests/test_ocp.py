@@ -0,0 +1,78 @@
+# -*- coding: utf8 -*-
+
+import subprocess
+import time
+
+import pytest
+
+from ocs_ci.ocs import ocp
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.ocp import OCP
+
+
+@pytest.fixture
+def procs(monkeypatch):
+    """
+    Run the commands given to OCP.follow_oc_cmds() as they are, without
+    'oc', and keep the started processes.
+    """
+    started = []
+    real_popen = subprocess.Popen
+
+    def popen(*args, **kwargs):
+        proc = real_popen(*args, **kwargs)
+        started.append(proc)
+        return proc
+
+    monkeypatch.setattr(OCP, "build_oc_cmd", lambda self, command: command)
+    monkeypatch.setattr(ocp.subprocess, "Popen", popen)
+    return started
+
+
+def test_follow_oc_cmds_output(procs):
+    """
+    The lines of all the commands should be collected, including the last
+    line without a newline, while stderr is not mixed in.
+    """
+    lines = list(
+        OCP().follow_oc_cmds(
+            ["printf 'a\\nb'", "sh -c 'echo c; echo warning >&2'"], timeout=30
+        )
+    )
+    assert sorted(lines) == ["a", "b", "c"]
+    assert all(proc.returncode == 0 for proc in procs)
+
+
+def test_follow_oc_cmds_failure(procs):
+    """
+    A command which exits with non zero code should raise CommandFailed with
+    its error output, after its output was yielded.
+    """
+    lines = []
+    with pytest.raises(CommandFailed, match="oh no"):
+        for line in OCP().follow_oc_cmds(
+            ["sh -c 'echo before; echo oh no >&2; exit 1'"], timeout=30
+        ):
+            lines.append(line)
+    assert lines == ["before"]
+
+
+def test_follow_oc_cmds_timeout(procs):
+    """
+    The commands should be terminated once the timeout expires.
+    """
+    start = time.monotonic()
+    lines = list(OCP().follow_oc_cmds(["sh -c 'echo start; exec sleep 60'"], timeout=1))
+    assert lines == ["start"]
+    assert time.monotonic() - start < 10
+    assert len(procs) == 1 and procs[0].poll() is not None
+
+
+def test_follow_oc_cmds_close(procs):
+    """
+    The commands should be terminated once the consumer stops iterating.
+    """
+    lines = OCP().follow_oc_cmds(["sh -c 'echo 1; echo 2; exec sleep 60'"], 30)
+    assert next(lines) == "1"
+    lines.close()
+    assert len(procs) == 1 and procs[0].poll() is not None
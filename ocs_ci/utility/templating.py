@@ -10,6 +10,10 @@ from ocs_ci.utility.utils import censor_values, get_url_content
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml based loader when PyYAML was built with it, it's
+# significantly faster than the pure python one
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config_data(data_path):
     """
@@ -151,12 +155,12 @@ def load_yaml(file, multi_document=False):
             iteration returns dict from one loaded document from a file.
 
     """
-    loader = yaml.safe_load_all if multi_document else yaml.safe_load
+    loader = yaml.load_all if multi_document else yaml.load
     if file.startswith("http"):
-        return loader(get_url_content(file))
+        return loader(get_url_content(file), Loader=SafeLoader)
     else:
         with open(file, "r") as fs:
-            return loader(fs.read())
+            return loader(fs.read(), Loader=SafeLoader)
 
 
 def get_n_document_from_yaml(yaml_generator, index=0):
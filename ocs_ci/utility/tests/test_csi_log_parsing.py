@@ -0,0 +1,117 @@
+# -*- coding: utf8 -*-
+
+import datetime
+import re
+
+# helpers can be imported only after the pod module, they import each other
+from ocs_ci.ocs.resources import pod  # noqa: F401
+from ocs_ci.helpers.helpers import (
+    DATE_TIME_FORMAT,
+    PV_DELETE_LOG_PATTERN,
+    PVC_PROVISION_LOG_PATTERN,
+    get_csi_log_events,
+    parse_log_time,
+)
+
+
+PROVISION_LOGS = [
+    "I0521 23:59:58.100000       1 controller.go:1332] provision "
+    '"ns/pvc-a" class "sc": started',
+    "I0521 23:59:59.900000       1 controller.go:1332] provision "
+    '"ns/pvc-b" class "sc": started',
+    "I0521 23:59:59.950000       1 connection.go:183] GRPC call: "
+    "/csi.v1.Controller/CreateVolume",
+    "I0522 00:00:00.400000       1 controller.go:1439] provision "
+    '"ns/pvc-b" class "sc": volume "pvc-2" provisioned',
+    "I0522 00:00:00.400100       1 controller.go:1456] provision "
+    '"ns/pvc-b" class "sc": succeeded',
+    "I0522 00:00:01.200000       1 controller.go:1456] provision "
+    '"ns/pvc-a" class "sc": succeeded',
+    "I0522 00:00:05.000000       1 controller.go:1456] provision "
+    '"ns/pvc-a" class "sc": succeeded',
+]
+
+
+def test_parse_log_time():
+    """
+    parse_log_time() should give the same result as strptime() with the
+    DATE_TIME_FORMAT, also for fractions shorter than microseconds.
+    """
+    for timestamp in ("2021 I0521 10:11:12.123456", "2021 I1231 23:59:59.5"):
+        assert parse_log_time(timestamp) == datetime.datetime.strptime(
+            timestamp, DATE_TIME_FORMAT
+        )
+
+
+def test_csi_log_events_provision():
+    """
+    The first occurrence of every event of each PVC should be found, lines
+    of other PVCs and other messages should be ignored.
+    """
+    events = get_csi_log_events(
+        PROVISION_LOGS,
+        PVC_PROVISION_LOG_PATTERN,
+        ["pvc-a", "pvc-b"],
+        marker="provision",
+    )
+    assert events == {
+        "pvc-a": {
+            "started": "I0521 23:59:58.100000",
+            "succeeded": "I0522 00:00:01.200000",
+        },
+        "pvc-b": {
+            "started": "I0521 23:59:59.900000",
+            "succeeded": "I0522 00:00:00.400100",
+        },
+    }
+
+
+def test_csi_log_events_over_midnight():
+    """
+    The time of an event which rolls over midnight should be measured from
+    the day in the log line header.
+    """
+    events = get_csi_log_events(PROVISION_LOGS, PVC_PROVISION_LOG_PATTERN, ["pvc-b"])
+    start = parse_log_time(f"2021 {events['pvc-b']['started']}")
+    end = parse_log_time(f"2021 {events['pvc-b']['succeeded']}")
+    assert (end - start).total_seconds() == 0.5001
+
+
+def test_csi_log_events_missing():
+    """
+    A resource without events in the logs should have no events, and lines
+    without the marker should be skipped even if the pattern matches them.
+    """
+    logs = PROVISION_LOGS + ['I0522 00:00:06.000000  1 delete "pvc-c": started']
+    pattern = re.compile(r'"(?:[^"/]*/)?([^"]+)".*?: (started|succeeded)')
+    events = get_csi_log_events(logs, pattern, ["pvc-a", "pvc-c"], marker="provision")
+    assert events["pvc-c"] == {}
+    assert set(events["pvc-a"]) == {"started", "succeeded"}
+    assert get_csi_log_events(logs, pattern, ["pvc-c"])["pvc-c"] == {
+        "started": "I0522 00:00:06.000000"
+    }
+
+
+def test_csi_log_events_until():
+    """
+    Once all the 'until' events are found for every resource, the rest of
+    the logs shouldn't be read.
+    """
+    logs = iter(
+        [
+            'I0521 10:00:00.000000  1 delete "pv-1": started',
+            'I0521 10:00:01.000000  1 delete "pv-2": started',
+            'I0521 10:00:02.000000  1 delete "pv-1": succeeded',
+            'I0521 10:00:03.000000  1 delete "pv-2": succeeded',
+            'I0521 10:00:04.000000  1 delete "pv-3": started',
+        ]
+    )
+    events = get_csi_log_events(
+        logs,
+        PV_DELETE_LOG_PATTERN,
+        ["pv-1", "pv-2"],
+        marker="delete",
+        until=("started", "succeeded"),
+    )
+    assert events["pv-2"]["succeeded"] == "I0521 10:00:03.000000"
+    assert next(logs) == 'I0521 10:00:04.000000  1 delete "pv-3": started'
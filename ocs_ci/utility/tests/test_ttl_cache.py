@@ -0,0 +1,113 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.utility import ttl_cache as ttl_cache_module
+from ocs_ci.utility.ttl_cache import ttl_cache
+
+
+class FakeClock:
+    """
+    Replacement of time.monotonic() which only moves when told to.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(ttl_cache_module.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+def test_ttl_cache_reuses_result(clock):
+    """
+    Calling the cached function again within the ttl should not call the
+    wrapped function, while calling it with other arguments should.
+    """
+    calls = []
+
+    @ttl_cache(ttl=10)
+    def func(x):
+        calls.append(x)
+        return x * 2
+
+    assert func(1) == 2
+    assert func(1) == 2
+    assert func(2) == 4
+    assert calls == [1, 2]
+
+
+def test_ttl_cache_expires(clock):
+    """
+    The cached result should be recomputed once the ttl is over.
+    """
+    calls = []
+
+    @ttl_cache(ttl=10)
+    def func():
+        calls.append(1)
+        return len(calls)
+
+    assert func() == 1
+    clock.now += 9
+    assert func() == 1
+    clock.now += 2
+    assert func() == 2
+
+
+def test_ttl_cache_clear(clock):
+    """
+    cache_clear() should force the next call to reach the wrapped function.
+    """
+    calls = []
+
+    @ttl_cache(ttl=10)
+    def func():
+        calls.append(1)
+        return len(calls)
+
+    assert func() == 1
+    func.cache_clear()
+    assert func() == 2
+
+
+def test_ttl_cache_does_not_cache_exceptions(clock):
+    """
+    A failing call should not be cached, so the next call tries again.
+    """
+    calls = []
+
+    @ttl_cache(ttl=10)
+    def func():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ValueError("first call fails")
+        return len(calls)
+
+    with pytest.raises(ValueError):
+        func()
+    assert func() == 2
+    assert func() == 2
+
+
+def test_ttl_cache_scope(clock):
+    """
+    Results cached in one scope should not be returned in another one.
+    """
+    current_scope = ["a"]
+
+    @ttl_cache(ttl=10, scope=lambda: current_scope[0])
+    def func():
+        return current_scope[0]
+
+    assert func() == "a"
+    current_scope[0] = "b"
+    assert func() == "b"
+    current_scope[0] = "a"
+    assert func() == "a"
@@ -195,3 +195,44 @@ def test_ts_wait_for_value_negative(caplog):
         assert "function <lambda> failed" in log_msg
         assert "failed to return expected value 2" in log_msg
         assert "during 3 second timeout" in log_msg
+
+
+def test_ts_backoff(monkeypatch):
+    """
+    Check that the sleep interval grows by backoff_factor after each
+    iteration and doesn't exceed max_sleep.
+    """
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    ts = TimeoutSampler(60, 1, lambda: 1)
+    ts.backoff_factor = 2
+    ts.max_sleep = 8
+    for i, _ in enumerate(ts):
+        if i == 6:
+            break
+    assert sleeps == [1, 2, 4, 8, 8, 8]
+
+
+def test_ts_backoff_timeout(monkeypatch):
+    """
+    Check that a grown sleep interval doesn't run past the timeout and that
+    one more sample is taken at the timeout.
+    """
+    clock = [0]
+    sleeps = []
+    sample_times = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+    ts = TimeoutSampler(20, 2, lambda: sample_times.append(clock[0]))
+    ts.backoff_factor = 2
+    with pytest.raises(TimeoutExpiredError):
+        for _ in ts:
+            pass
+    assert sleeps == [2, 4, 8, 6]
+    assert sample_times == [0, 2, 6, 14, 20]
+    assert clock[0] == 20
@@ -0,0 +1,55 @@
+import logging
+import threading
+import time
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+
+def ttl_cache(ttl=300, scope=None):
+    """
+    Cache the results of the decorated function for a limited amount of time.
+
+    The results are cached per the positional and keyword arguments the
+    function was called with, so all of them have to be hashable. Exceptions
+    are not cached. The decorated function gets a cache_clear() attribute
+    which drops all the cached results, e.g. when the cached resource is
+    known to be recreated.
+
+    Args:
+        ttl (int): Time in seconds for which a cached result is valid
+        scope (function): Optional function called on every lookup, its
+            result becomes a part of the cache key. Useful to keep separate
+            results e.g. per cluster the config currently points to
+
+    """
+
+    def deco_ttl_cache(f):
+        cache = {}
+        lock = threading.Lock()
+
+        @wraps(f)
+        def f_ttl_cache(*args, **kwargs):
+            key = (
+                scope() if scope else None,
+                args,
+                tuple(sorted(kwargs.items())),
+            )
+            with lock:
+                cached = cache.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            result = f(*args, **kwargs)
+            with lock:
+                cache[key] = (time.monotonic(), result)
+            return result
+
+        def cache_clear():
+            logger.debug(f"Clearing the cached results of {f.__name__}")
+            with lock:
+                cache.clear()
+
+        f_ttl_cache.cache_clear = cache_clear
+        return f_ttl_cache
+
+    return deco_ttl_cache
@@ -16,7 +16,6 @@ import stat
 from copy import deepcopy
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from scipy.stats import tmean, scoreatpercentile
 from shutil import which, move, rmtree
 import pexpect
 
@@ -1068,7 +1067,11 @@ class TimeoutSampler(object):
 
     Yielding the output allows you to handle every value as you wish.
 
-    Feel free to set the instance variables.
+    Feel free to set the instance variables. E.g. set `backoff_factor` to
+    multiply the sleep interval after each iteration (exponential backoff),
+    optionally capped by `max_sleep`. A sleep never runs past the timeout,
+    and when a grown sleep interval is cut by the timeout, one more sample
+    is taken at the timeout.
 
 
     Args:
@@ -1090,6 +1093,10 @@ class TimeoutSampler(object):
         self.func_args = func_args
         self.func_kwargs = func_kwargs
 
+        # Multiplier of the sleep interval applied after each iteration and
+        # the upper limit of the sleep interval (None for no limit)
+        self.backoff_factor = 1
+        self.max_sleep = None
         # Timestamps of the first and most recent samples
         self.start_time = None
         self.last_sample_time = None
@@ -1120,19 +1127,30 @@ class TimeoutSampler(object):
     def __iter__(self):
         if self.start_time is None:
             self.start_time = time.time()
+        sleep = self.sleep
+        last_sample = False
         while True:
             self.last_sample_time = time.time()
-            if self.timeout <= (self.last_sample_time - self.start_time):
+            if not last_sample and self.timeout <= (
+                self.last_sample_time - self.start_time
+            ):
                 raise self.timeout_exc_cls(*self.timeout_exc_args)
             try:
                 yield self.func(*self.func_args, **self.func_kwargs)
             except Exception as ex:
                 msg = f"Exception raised during iteration: {ex}"
                 log.exception(msg)
-            if self.timeout <= (time.time() - self.start_time):
+            remaining = self.timeout - (time.time() - self.start_time)
+            if last_sample or remaining <= 0:
                 raise self.timeout_exc_cls(*self.timeout_exc_args)
-            log.info("Going to sleep for %d seconds before next iteration", self.sleep)
-            time.sleep(self.sleep)
+            # a grown sleep interval cut by the timeout is followed by one
+            # more sample, as the plain sleep interval would have sampled there
+            last_sample = sleep > self.sleep and sleep >= remaining
+            log.info("Going to sleep for %d seconds before next iteration", sleep)
+            time.sleep(min(sleep, remaining))
+            sleep *= self.backoff_factor
+            if self.max_sleep is not None:
+                sleep = min(sleep, self.max_sleep)
 
     def wait_for_func_value(self, value):
         """
@@ -2992,6 +3010,9 @@ def get_trim_mean(values, percentage=20):
             the regular mean average is returned
 
     """
+    # scipy.stats is heavy to import and only needed here
+    from scipy.stats import tmean, scoreatpercentile
+
     lower_limit = scoreatpercentile(values, percentage)
     upper_limit = scoreatpercentile(values, 100 - percentage)
     try:
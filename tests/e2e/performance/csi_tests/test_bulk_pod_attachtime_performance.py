@@ -122,7 +122,6 @@ class TestBulkPodAttachPerformance(PASTest):
         )
 
         for pvc_obj in pvc_objs:
-            pvc_obj.reload()
             teardown_factory(pvc_obj)
         with ThreadPoolExecutor(max_workers=5) as executor:
             for pvc_obj in pvc_objs:
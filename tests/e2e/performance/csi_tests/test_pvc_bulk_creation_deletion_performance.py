@@ -154,7 +154,6 @@ class TestPVCCreationPerformance(PASTest):
         logging.info(f"PVC creation dir is {yaml_creation_dir}")
 
         for pvc_obj in pvc_objs:
-            pvc_obj.reload()
             teardown_factory(pvc_obj)
         with ThreadPoolExecutor(max_workers=5) as executor:
             for pvc_obj in pvc_objs:
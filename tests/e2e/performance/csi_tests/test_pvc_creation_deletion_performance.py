@@ -421,7 +421,6 @@ class TestPVCCreationDeletionPerformance(PASTest):
         )
 
         for pvc_obj in pvc_objs:
-            pvc_obj.reload()
             teardown_factory(pvc_obj)
 
         timeout = 600 if self.interface == constants.CEPHBLOCKPOOL_THICK else 60
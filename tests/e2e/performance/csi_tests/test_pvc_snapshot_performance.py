@@ -111,14 +111,17 @@ class TestPvcSnapshotPerformance(PASTest):
 
         # Getting the snapshot content name
         self.snap_content = helpers.get_snapshot_content_obj(self.snap_obj)
-        self.snap_uid = (
-            self.snap_content.data.get("spec").get("volumeSnapshotRef").get("uid")
-        )
+        snap_ref = self.snap_content.data.get("spec").get("volumeSnapshotRef")
+        self.snap_uid = snap_ref.get("uid")
         log.info(f"The snapshot UID is :{self.snap_uid}")
 
         # Measure the snapshot creation time
         c_time = helpers.measure_snapshot_creation_time(
-            interface, snap_name, self.snap_content.name, self.snap_uid
+            interface,
+            snap_name,
+            self.snap_content.name,
+            self.snap_uid,
+            snap_namespace=snap_ref.get("namespace"),
         )
         return c_time
 